@@ -0,0 +1,6 @@
+"""
+Package metadata for the Dataiku MCP tool suite.
+"""
+
+__version__ = "0.1.0"
+__author__ = "Dataiku Factory"
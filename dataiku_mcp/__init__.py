@@ -5,5 +5,11 @@ A Model Context Protocol (MCP) tool suite for Dataiku DSS integration.
 Provides tools for recipes, datasets, and scenarios management.
 """
 
-__version__ = "0.1.0"
-__author__ = "Dataiku Factory"
+
+def __getattr__(name: str):
+    """Resolve package metadata from __about__ on first access."""
+    if name in ("__version__", "__author__"):
+        from dataiku_mcp import __about__
+
+        return getattr(__about__, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
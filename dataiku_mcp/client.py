@@ -2,15 +2,44 @@
 Dataiku DSS client wrapper for MCP integration.
 """
 
+import asyncio
+import functools
 import os
+import ssl
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
 
 import dataikuapi
+import urllib3
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
 
 _CLIENT_INSTANCE: dataikuapi.DSSClient | None = None
+_CLIENT_LOCK = threading.Lock()
+_ASYNC_CLIENT_LOCK = asyncio.Lock()
+
+# Fetched on first get_dss_version() call; fixed for the process lifetime
+_DSS_VERSION: str | None = None
+
+# Identity behind DSS_API_KEY, recorded by the connection probe
+_AUTH_INFO: dict[str, Any] | None = None
+
+# Retries apply to idempotent requests only (urllib3 default allowed methods)
+_RETRY_STATUS_CODES = (502, 503, 504)
+
+# Instance metadata (project list, version) rarely changes; serve it from a
+# short-lived cache and refresh stale entries in the background.
+_META_TTL = float(os.environ.get("DSS_META_TTL", "30"))
+_META_CACHE: dict[Hashable, tuple[float, Any]] = {}
+_META_REFRESHING: set[Hashable] = set()
+_META_LOCK = threading.Lock()
 
 
 def get_client() -> dataikuapi.DSSClient:
@@ -27,22 +56,57 @@ def get_client() -> dataikuapi.DSSClient:
     global _CLIENT_INSTANCE
 
     if _CLIENT_INSTANCE is None:
-        _CLIENT_INSTANCE = _create_client()
+        with _CLIENT_LOCK:
+            if _CLIENT_INSTANCE is None:
+                _CLIENT_INSTANCE = _create_client()
 
     return _CLIENT_INSTANCE
 
 
-def _create_client() -> dataikuapi.DSSClient:
+async def aget_client() -> dataikuapi.DSSClient:
     """
-    Create a new DSS client instance.
+    Async variant of get_client() for use from event-loop code.
+
+    The first call runs client creation (TLS handshake and connection
+    probe) in a worker thread so the event loop is not blocked; concurrent
+    callers wait on the same creation instead of starting their own.
 
     Returns:
-        dataikuapi.DSSClient: New DSS client instance
+        dataikuapi.DSSClient: Configured DSS client
+    """
+    if _CLIENT_INSTANCE is not None:
+        return _CLIENT_INSTANCE
+
+    async with _ASYNC_CLIENT_LOCK:
+        return await asyncio.to_thread(get_client)
+
+
+class _DSSConfig(NamedTuple):
+    """Connection settings read from the environment."""
+
+    host: str
+    api_key: str
+    insecure_tls: bool
+    pool_size: int
+    connect_timeout: float
+
+
+@functools.cache
+def _config() -> _DSSConfig:
+    """
+    Read and validate DSS connection settings from the environment.
+
+    Parsed once per process; reset_client() clears the cache so changed
+    environment variables are picked up.
+
+    Returns:
+        _DSSConfig: Parsed connection settings
+
+    Raises:
+        ValueError: If required environment variables are missing
     """
-    # Get configuration from environment
     dss_host = os.environ.get("DSS_HOST")
     dss_api_key = os.environ.get("DSS_API_KEY")
-    insecure_tls = os.environ.get("DSS_INSECURE_TLS", "true").lower() == "true"
 
     if not dss_host:
         raise ValueError("DSS_HOST environment variable is required")
@@ -50,30 +114,204 @@ def _create_client() -> dataikuapi.DSSClient:
     if not dss_api_key:
         raise ValueError("DSS_API_KEY environment variable is required")
 
+    return _DSSConfig(
+        host=dss_host,
+        api_key=dss_api_key,
+        insecure_tls=(
+            os.environ.get("DSS_INSECURE_TLS", "true").lower() == "true"
+        ),
+        pool_size=int(os.environ.get("DSS_POOL_SIZE", "32")),
+        connect_timeout=float(os.environ.get("DSS_CONNECT_TIMEOUT", "5")),
+    )
+
+
+def _create_client() -> dataikuapi.DSSClient:
+    """
+    Create a new DSS client instance.
+
+    Returns:
+        dataikuapi.DSSClient: New DSS client instance
+    """
+    global _AUTH_INFO
+    config = _config()
+
     try:
         client = dataikuapi.DSSClient(
-            dss_host,
-            dss_api_key,
-            insecure_tls=insecure_tls
+            config.host,
+            config.api_key,
+            insecure_tls=config.insecure_tls
+        )
+        _configure_session(
+            client,
+            config.pool_size,
+            config.insecure_tls,
+            config.connect_timeout,
         )
 
-        # Test connection
-        client.get_instance_info()
+        # Test connection and API key with the lightweight auth-info call;
+        # keep the result, since the key's identity cannot change
+        _AUTH_INFO = client.get_auth_info()
 
         return client
 
     except Exception as e:
         raise ConnectionError(
-            f"Failed to connect to DSS at {dss_host}: {e}"
+            f"Failed to connect to DSS at {config.host}: {e}"
         ) from e
 
 
+class _PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools share one prebuilt SSLContext and
+    whose requests get a default connect timeout.
+    """
+
+    def __init__(
+        self,
+        ssl_context: ssl.SSLContext | None = None,
+        connect_timeout: float | None = None,
+        **kwargs,
+    ):
+        self._ssl_context = ssl_context
+        self._connect_timeout = connect_timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        # dataikuapi never passes a timeout; bound the connect phase only,
+        # since builds and SQL queries legitimately stream for a long time
+        if timeout is None:
+            timeout = (self._connect_timeout, None)
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def _insecure_ssl_context() -> ssl.SSLContext:
+    """Build an SSLContext that skips certificate and hostname checks."""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _configure_session(
+    client: dataikuapi.DSSClient,
+    pool_size: int,
+    insecure_tls: bool,
+    connect_timeout: float | None = None,
+):
+    """
+    Mount a pooled, retrying HTTP adapter on the client's requests session.
+
+    DSSClient keeps a single requests.Session (with auth and TLS settings
+    already applied) in ``_session``. The default adapter only keeps 10
+    connections per host and never retries, so concurrent tool calls open
+    throwaway connections and transient gateway errors surface as failures.
+
+    The pool does not block when exhausted: a burst beyond pool_size
+    opens extra connections that are discarded after use. Blocking would
+    hang every DSS call in the process once a streamed response is left
+    unreleased, since requests gives urllib3 no pool timeout.
+
+    With insecure TLS, every pooled connection reuses one unverified
+    SSLContext and the per-request InsecureRequestWarning is silenced.
+
+    Connecting to an unreachable host fails after connect_timeout seconds
+    instead of hanging a worker thread; reads are not time-limited.
+
+    Args:
+        client: DSS client whose session should be configured
+        pool_size: Maximum number of pooled keep-alive connections
+        insecure_tls: Whether certificate verification is disabled
+        connect_timeout: Seconds allowed to establish a connection
+    """
+    ssl_context = None
+    if insecure_tls:
+        ssl_context = _insecure_ssl_context()
+        urllib3.disable_warnings(InsecureRequestWarning)
+
+    adapter = _PooledHTTPAdapter(
+        ssl_context=ssl_context,
+        connect_timeout=connect_timeout,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=_RETRY_STATUS_CODES,
+            # Hand the last 5xx response back so dataikuapi reports
+            # the DSS error instead of a urllib3 MaxRetryError
+            raise_on_status=False,
+        ),
+    )
+    client._session.mount("https://", adapter)
+    client._session.mount("http://", adapter)
+
+
 def reset_client():
     """
     Reset the client instance (useful for testing).
     """
-    global _CLIENT_INSTANCE
-    _CLIENT_INSTANCE = None
+    global _CLIENT_INSTANCE, _DSS_VERSION, _AUTH_INFO
+    with _CLIENT_LOCK:
+        if _CLIENT_INSTANCE is not None:
+            _CLIENT_INSTANCE._session.close()
+        _CLIENT_INSTANCE = None
+    _DSS_VERSION = None
+    _AUTH_INFO = None
+    with _META_LOCK:
+        _META_CACHE.clear()
+    _get_project_handle.cache_clear()
+    _config.cache_clear()
+
+
+def cached_metadata(key: Hashable, fetch: Callable[[], Any]) -> Any:
+    """
+    Return a cached metadata value, fetching it on first use.
+
+    Entries older than DSS_META_TTL seconds are still returned, but trigger
+    a single background refresh so the next read sees fresh data without
+    paying the round-trip itself.
+
+    Args:
+        key: Cache key
+        fetch: Zero-argument callable that retrieves the value from DSS
+
+    Returns:
+        The cached (possibly stale) value
+    """
+    entry = _META_CACHE.get(key)
+    if entry is None:
+        value = fetch()
+        _META_CACHE[key] = (time.monotonic() + _META_TTL, value)
+        return value
+
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        with _META_LOCK:
+            if key in _META_REFRESHING:
+                return value
+            _META_REFRESHING.add(key)
+        threading.Thread(
+            target=_refresh_metadata, args=(key, fetch), daemon=True
+        ).start()
+    return value
+
+
+def _refresh_metadata(key: Hashable, fetch: Callable[[], Any]):
+    """Refresh one metadata cache entry; keep the stale value on failure."""
+    try:
+        value = fetch()
+        _META_CACHE[key] = (time.monotonic() + _META_TTL, value)
+    except Exception:
+        pass
+    finally:
+        with _META_LOCK:
+            _META_REFRESHING.discard(key)
 
 
 CLAUDE_WRITE_TAG = "claude write"
@@ -109,9 +347,13 @@ class SafeDSSProject:
 
     _BLOCKED_METHODS = {"delete"}
 
-    def __init__(self, project: dataikuapi.dss.project.DSSProject):
+    def __init__(
+        self,
+        project: dataikuapi.dss.project.DSSProject,
+        write_checked: bool | None = None,
+    ):
         self._project = project
-        self._write_checked = None  # Cache: None = not checked, True/False = result
+        self._write_checked = write_checked  # Cache: None = not checked, True/False = result
 
     def _check_write_access(self, method_name: str):
         """Raise if project lacks 'Claude Write' tag."""
@@ -136,6 +378,20 @@ class SafeDSSProject:
         return getattr(self._project, name)
 
 
+@functools.lru_cache(maxsize=256)
+def _get_project_handle(
+    project_key: str,
+) -> dataikuapi.dss.project.DSSProject:
+    """
+    Get the shared DSSProject handle for a project key.
+
+    Handles only hold the client and key, so one per key is reused across
+    tool calls. Each caller still gets its own SafeDSSProject, so write-tag
+    checks are never served from a previous call.
+    """
+    return get_client().get_project(project_key)
+
+
 def get_project(project_key: str) -> SafeDSSProject:
     """
     Get a DSS project by key, wrapped with safety guards.
@@ -149,8 +405,7 @@ def get_project(project_key: str) -> SafeDSSProject:
     Returns:
         SafeDSSProject: Safety-wrapped project instance
     """
-    client = get_client()
-    return SafeDSSProject(client.get_project(project_key))
+    return SafeDSSProject(_get_project_handle(project_key))
 
 
 def get_project_for_write(project_key: str) -> SafeDSSProject:
@@ -169,14 +424,15 @@ def get_project_for_write(project_key: str) -> SafeDSSProject:
     Raises:
         PermissionError: If project lacks 'Claude Write' tag
     """
-    client = get_client()
-    project = client.get_project(project_key)
+    project = _get_project_handle(project_key)
     if not _has_claude_write_tag(project):
         raise PermissionError(
             f"Project '{project_key}' is read-only (no 'Claude Write' tag). "
             f"Add a 'Claude Write' tag in DSS UI to allow modifications."
         )
-    return SafeDSSProject(project)
+    # The tag was just verified; don't fetch the metadata again on the
+    # first write made through the wrapper.
+    return SafeDSSProject(project, write_checked=True)
 
 
 def list_projects() -> list[str]:
@@ -186,8 +442,10 @@ def list_projects() -> list[str]:
     Returns:
         list[str]: List of project keys
     """
-    client = get_client()
-    return client.list_project_keys()
+    keys = cached_metadata(
+        "project_keys", lambda: get_client().list_project_keys()
+    )
+    return list(keys)
 
 
 def get_dss_version() -> str:
@@ -197,5 +455,25 @@ def get_dss_version() -> str:
     Returns:
         str: DSS version string
     """
+    global _DSS_VERSION
+
+    if _DSS_VERSION is None:
+        info = get_client().get_instance_info()
+        _DSS_VERSION = info._data.get("dssVersion", "Unknown")
+    return _DSS_VERSION
+
+
+def get_auth_info() -> dict[str, Any]:
+    """
+    Get the authentication info of the configured API key.
+
+    Returns the result of the connection probe made when the client was
+    created, so no extra request is made.
+
+    Returns:
+        dict: DSS auth info (authIdentifier, groups, ...)
+    """
     client = get_client()
-    return client.get_instance_info()._data.get("dssVersion", "Unknown")
+    if _AUTH_INFO is None:
+        return client.get_auth_info()
+    return _AUTH_INFO
@@ -0,0 +1,37 @@
+"""
+JSON serialization helpers for MCP responses.
+
+Uses orjson when installed (``pip install dataiku-mcp[fast]``), then ujson,
+and falls back to the standard library otherwise. Output is always compact
+(no whitespace between separators) to keep MCP payloads small.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+
+except ImportError:
+    try:
+        import ujson
+
+        def dumps(obj: Any) -> str:
+            """Serialize an object to a JSON string."""
+            return ujson.dumps(obj)
+
+        loads = ujson.loads
+
+    except ImportError:
+        import json
+
+        def dumps(obj: Any) -> str:
+            """Serialize an object to a JSON string."""
+            return json.dumps(obj, separators=(",", ":"))
+
+        loads = json.loads
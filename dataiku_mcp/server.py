@@ -2,36 +2,158 @@
 MCP Server for Dataiku DSS integration.
 """
 
-import json
+import asyncio
+import functools
+import importlib
+import inspect
 import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from types import ModuleType
 from typing import Any
 
+import anyio.to_thread
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.utilities.func_metadata import (
+    FuncMetadata,
+    func_metadata,
+)
+from mcp.types import TextContent
+from mcp.types import Tool as MCPTool
+from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
+
+from dataiku_mcp.client import (
+    cached_metadata,
+    get_project,
+    list_projects,
+)
+from dataiku_mcp.serialization import dumps
+
+
+class _LazyToolModule:
+    """
+    Stand-in for a ``dataiku_mcp.tools`` submodule, imported on first use.
+
+    Tool wrappers below only touch their implementation module when the tool
+    is actually called, so a session that uses a handful of tools never
+    imports the rest.
+    """
+
+    def __init__(self, name: str):
+        self._name = f"dataiku_mcp.tools.{name}"
+        self._module: ModuleType | None = None
+
+    def load(self) -> ModuleType:
+        """Import the underlying module (a no-op once imported)."""
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+
+advanced_scenarios = _LazyToolModule("advanced_scenarios")
+code_development = _LazyToolModule("code_development")
+datasets = _LazyToolModule("datasets")
+environment_config = _LazyToolModule("environment_config")
+managed_folders = _LazyToolModule("managed_folders")
+monitoring_debug = _LazyToolModule("monitoring_debug")
+productivity = _LazyToolModule("productivity")
+project_exploration = _LazyToolModule("project_exploration")
+recipes = _LazyToolModule("recipes")
+scenarios = _LazyToolModule("scenarios")
+sql_execution = _LazyToolModule("sql_execution")
 
-from dataiku_mcp.client import get_project, list_projects
-from dataiku_mcp.tools import (
-    administration,
-    advanced_scenarios,
-    code_development,
-    data_quality,
-    datasets,
-    deployment,
-    environment_config,
-    managed_folders,
-    monitoring_debug,
-    productivity,
-    project_exploration,
-    recipes,
-    scenarios,
-    sql_execution,
+_LAZY_TOOL_MODULES = (
+    advanced_scenarios, code_development, datasets, environment_config,
+    managed_folders, monitoring_debug, productivity, project_exploration,
+    recipes, scenarios, sql_execution,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the entrypoint (scripts/mcp_server.py), so
+# embedding the server doesn't install a second root handler
 logger = logging.getLogger(__name__)
 
+# Worker threads available to tool calls; each in-flight call holds one
+# while it waits on DSS
+_TOOL_THREADS = int(os.environ.get("DSS_TOOL_THREADS", "64"))
+
+# Tool calls allowed to run against DSS at the same time; further calls
+# wait their turn instead of piling onto the DSS backend
+_MAX_INFLIGHT = int(os.environ.get("DSS_MAX_INFLIGHT", "16"))
+_INFLIGHT = asyncio.Semaphore(_MAX_INFLIGHT)
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """
+    Size the worker thread pool used to run blocking tool calls.
+
+    The lifespan can run once per session under the SSE and HTTP
+    transports, so it must not tear down the shared DSS client; the
+    entrypoint closes it once at process shutdown.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, _TOOL_THREADS)
+    yield {}
+
+
+class _DataikuMCP(FastMCP):
+    """
+    FastMCP server that builds its tools/list response once and returns
+    dict tool results as compact JSON.
+
+    The tool set is fixed after import, but FastMCP rebuilds every tool
+    descriptor on each tools/list request (sent on every client connect).
+    The list is rebuilt only after a tool is added or removed.
+
+    FastMCP renders the text block of every dict result with indent=2,
+    which inflates the payload clients hand to the model; the text is
+    built from the structured content with serialization.dumps instead.
+    """
+
+    _tools_list: list[MCPTool] | None = None
+
+    async def list_tools(self) -> list[MCPTool]:
+        if self._tools_list is None:
+            self._tools_list = await super().list_tools()
+        return list(self._tools_list)
+
+    def add_tool(self, *args, **kwargs) -> None:
+        self._tools_list = None
+        super().add_tool(*args, **kwargs)
+
+    def remove_tool(self, name: str) -> None:
+        self._tools_list = None
+        super().remove_tool(name)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        result = await self._tool_manager.call_tool(
+            name, arguments, context=self.get_context(), convert_result=False
+        )
+        meta = self._tool_manager.get_tool(name).fn_metadata
+        if (
+            not isinstance(result, dict)
+            or meta.output_model is None
+            or meta.wrap_output
+        ):
+            return meta.convert_result(result)
+        structured = meta.output_model.model_validate(result).model_dump(
+            mode="json", by_alias=True
+        )
+        return [TextContent(type="text", text=dumps(structured))], structured
+
+
 # Create MCP server
-mcp = FastMCP("Dataiku DSS MCP Server")
+mcp = _DataikuMCP("Dataiku DSS MCP Server", lifespan=_lifespan)
 
 # Server description
 mcp.description = """
@@ -39,9 +161,233 @@ MCP server for Dataiku DSS. Manages recipes, datasets, scenarios, and
 project flows. Project keys are uppercase identifiers (e.g. 'DATAWAREHOUSE').
 """
 
+# Tool name -> registered wrapper, used by batch_call for dispatch
+_TOOL_REGISTRY: dict[str, Callable[..., dict[str, Any]]] = {}
+
+# Tool name -> argument model built once at registration, used to
+# validate batch_call arguments the same way FastMCP validates requests
+_TOOL_ARGS: dict[str, FuncMetadata] = {}
+
+_BATCH_MAX_PARALLEL = 32
+
+
+# Results of read-only metadata tools registered with _tool(cache=True),
+# keyed by (tool name, *bound arguments), least recently used first
+_RESULT_CACHE: OrderedDict[tuple, tuple[float, dict[str, Any]]] = (
+    OrderedDict()
+)
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_TTL = float(os.environ.get("DSS_TOOL_CACHE_TTL", "60"))
+_RESULT_CACHE_SIZE = int(os.environ.get("DSS_TOOL_CACHE_SIZE", "256"))
+
+
+def _bound_arguments(
+    signature: inspect.Signature,
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Map a call's arguments to parameter names, defaults included."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def _result_cache_key(
+    tool_name: str,
+    arguments: dict[str, Any],
+) -> tuple | None:
+    """Build a result cache key, or None if an argument is unhashable."""
+    key = (tool_name, *arguments.items())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _cached_result(key: tuple | None) -> dict[str, Any] | None:
+    """Return a cached tool result if present and not expired."""
+    if key is None:
+        return None
+    with _RESULT_CACHE_LOCK:
+        entry = _RESULT_CACHE.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _RESULT_CACHE[key]
+            return None
+        _RESULT_CACHE.move_to_end(key)
+        return entry[1]
+
+
+def _store_result(key: tuple, result: dict[str, Any]):
+    """
+    Cache a tool result, keeping at most DSS_TOOL_CACHE_SIZE entries.
+
+    Expired entries are purged first; if the cache is still full, the
+    least recently used entries are evicted.
+    """
+    now = time.monotonic()
+    with _RESULT_CACHE_LOCK:
+        for stale in [k for k, v in _RESULT_CACHE.items() if v[0] <= now]:
+            del _RESULT_CACHE[stale]
+        _RESULT_CACHE[key] = (now + _RESULT_CACHE_TTL, result)
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def _project_keys(arguments: dict[str, Any]) -> set[str]:
+    """
+    Collect the project keys a tool call names.
+
+    Besides project_key this covers arguments such as source_project_key
+    and target_project_key.
+    """
+    return {
+        value
+        for name, value in arguments.items()
+        if name.endswith("project_key") and isinstance(value, str)
+    }
+
+
+def _invalidate_results(project_keys: set[str]):
+    """Drop cached tool results that involve any of the given projects."""
+    if not project_keys:
+        return
+    with _RESULT_CACHE_LOCK:
+        for key in list(_RESULT_CACHE):
+            if any(
+                name.endswith("project_key") and value in project_keys
+                for name, value in key[1:]
+            ):
+                del _RESULT_CACHE[key]
+
+
+def _tool(
+    name: str | None = None,
+    description: str | None = None,
+    cache: bool = False,
+) -> Callable:
+    """
+    Register a function as an MCP tool and record it for batch dispatch.
+
+    Tool implementations make blocking DSS calls, so FastMCP is given an
+    async adapter that runs the function on a worker thread; the event
+    loop keeps serving other requests meanwhile. At most DSS_MAX_INFLIGHT
+    calls run at once. The decorated function itself is returned unchanged.
+
+    With cache=True, successful results are kept for DSS_TOOL_CACHE_TTL
+    seconds (at most DSS_TOOL_CACHE_SIZE of them) and a hit is returned
+    straight from the event loop without taking a worker thread. Any
+    uncached tool (i.e. a possible write) drops the entries of every
+    project it names, whether as project_key, target_project_key or
+    another *_project_key argument.
+    """
+    register = mcp.tool(name=name, description=description)
+
+    def decorator(fn: Callable[..., dict[str, Any]]):
+        tool_name = name or fn.__name__
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def call(*args, **kwargs) -> dict[str, Any]:
+            arguments = _bound_arguments(signature, args, kwargs)
+            if not cache:
+                result = fn(*args, **kwargs)
+                _invalidate_results(_project_keys(arguments))
+                return result
+
+            key = _result_cache_key(tool_name, arguments)
+            hit = _cached_result(key)
+            if hit is not None:
+                return hit
+            result = fn(*args, **kwargs)
+            if key is not None and result.get("status") == "ok":
+                _store_result(key, result)
+            return result
+
+        @functools.wraps(fn)
+        async def run_in_thread(*args, **kwargs) -> dict[str, Any]:
+            if cache:
+                arguments = _bound_arguments(signature, args, kwargs)
+                hit = _cached_result(_result_cache_key(tool_name, arguments))
+                if hit is not None:
+                    return hit
+            async with _INFLIGHT:
+                return await anyio.to_thread.run_sync(
+                    functools.partial(call, *args, **kwargs)
+                )
+
+        _TOOL_REGISTRY[tool_name] = call
+        _TOOL_ARGS[tool_name] = func_metadata(fn)
+        register(run_in_thread)
+        return fn
+
+    return decorator
+
+
+# Update arguments for the update_* tools. Every key is optional; only the
+# keys present are applied. typing_extensions.TypedDict is required by
+# pydantic on Python < 3.12.
+class RecipeUpdate(TypedDict, total=False):
+    """Recipe fields accepted by update_recipe."""
+
+    code: str
+    description: str
+    tags: list[str]
+    custom_fields: dict[str, Any]
+    engine_type: str
+    container_conf: Any
+    resource_settings: Any
+
+
+class DatasetUpdate(TypedDict, total=False):
+    """Dataset fields accepted by update_dataset."""
+
+    description: str
+    tags: list[str]
+    custom_fields: dict[str, Any]
+    format_type: str
+    format_params: dict[str, Any]
+    connection: str
+    path: str
+    table: str
+    schema: str
+
+
+class ScenarioUpdate(TypedDict, total=False):
+    """Scenario fields accepted by update_scenario."""
+
+    name: str
+    description: str
+    active: bool
+    tags: list[str]
+    custom_fields: dict[str, Any]
+    definition: dict[str, Any]
+    step_script: str
+    step_index: int
+
+
+class TriggerParams(TypedDict, total=False):
+    """Trigger settings accepted by add_scenario_trigger."""
+
+    every_minutes: int
+    starting_hour: int
+    minute_of_hour: int
+    repeat_every: int
+    hour: int
+    minute: int
+    year: int
+    month: int
+    day: int
+    timezone: str
+    dataset_name: str
+    dataset_project_key: str
+
 
 # Register Recipe Tools
-@mcp.tool()
+@_tool()
 def create_recipe(
     project_key: str,
     recipe_type: str,
@@ -71,11 +417,11 @@ def create_recipe(
         inputs, outputs, code,
     )
 
-@mcp.tool()
+@_tool()
 def update_recipe(
     project_key: str,
     recipe_name: str,
-    **kwargs: Any
+    updates: RecipeUpdate
 ) -> dict[str, Any]:
     """
     Update an existing recipe's settings or code.
@@ -83,16 +429,17 @@ def update_recipe(
     Args:
         project_key: Dataiku project key, uppercase (e.g. 'DATAWAREHOUSE')
         recipe_name: Name of the recipe to update
-        **kwargs: Recipe settings to update (e.g. code, inputs, outputs)
+        updates: Fields to update (code, description, tags, custom_fields,
+            engine_type, container_conf, resource_settings)
 
     Returns:
         Dict with update status
     """
     return recipes.update_recipe(
-        project_key, recipe_name, **kwargs
+        project_key, recipe_name, **updates
     )
 
-@mcp.tool()
+@_tool()
 def delete_recipe(
     project_key: str,
     recipe_name: str
@@ -111,7 +458,7 @@ def delete_recipe(
         project_key, recipe_name
     )
 
-@mcp.tool()
+@_tool()
 def run_recipe(
     project_key: str,
     recipe_name: str,
@@ -133,7 +480,7 @@ def run_recipe(
         project_key, recipe_name, build_mode
     )
 
-@mcp.tool()
+@_tool()
 def compute_schema_updates(
     project_key: str,
     recipe_name: str
@@ -156,7 +503,7 @@ def compute_schema_updates(
     )
 
 # Register Dataset Tools
-@mcp.tool()
+@_tool()
 def create_dataset(
     project_key: str,
     dataset_name: str,
@@ -180,11 +527,11 @@ def create_dataset(
         dataset_type, params,
     )
 
-@mcp.tool()
+@_tool()
 def update_dataset(
     project_key: str,
     dataset_name: str,
-    **kwargs: Any
+    updates: DatasetUpdate
 ) -> dict[str, Any]:
     """
     Update dataset settings.
@@ -192,16 +539,17 @@ def update_dataset(
     Args:
         project_key: Dataiku project key, uppercase (e.g. 'DATAWAREHOUSE')
         dataset_name: Name of the dataset to update
-        **kwargs: Dataset settings to update (connection, schema, params, etc.)
+        updates: Fields to update (description, tags, custom_fields,
+            format_type, format_params, connection, path, table, schema)
 
     Returns:
         Dict with update status
     """
     return datasets.update_dataset(
-        project_key, dataset_name, **kwargs
+        project_key, dataset_name, **updates
     )
 
-@mcp.tool()
+@_tool()
 def delete_dataset(
     project_key: str,
     dataset_name: str,
@@ -222,12 +570,13 @@ def delete_dataset(
         project_key, dataset_name, drop_data
     )
 
-@mcp.tool()
+@_tool()
 def build_dataset(
     project_key: str,
     dataset_name: str,
     mode: str | None = None,
-    partition: str | None = None
+    partition: str | None = None,
+    wait: bool = False
 ) -> dict[str, Any]:
     """
     Build a dataset by running its upstream recipe.
@@ -238,15 +587,18 @@ def build_dataset(
         mode: Build mode ('RECURSIVE_BUILD',
             'NON_RECURSIVE_FORCED_BUILD', etc.)
         partition: Partition spec for partitioned datasets
+        wait: Set to true to wait (up to 10 minutes) for the build to
+            finish; by default the job ID is returned as soon as the
+            build starts (check progress with get_job_details)
 
     Returns:
         Dict with job ID and build status
     """
     return datasets.build_dataset(
-        project_key, dataset_name, mode, partition
+        project_key, dataset_name, mode, partition, wait
     )
 
-@mcp.tool()
+@_tool(cache=True)
 def inspect_dataset_schema(
     project_key: str,
     dataset_name: str
@@ -265,7 +617,7 @@ def inspect_dataset_schema(
         project_key, dataset_name
     )
 
-@mcp.tool()
+@_tool()
 def check_dataset_metrics(
     project_key: str,
     dataset_name: str
@@ -284,7 +636,7 @@ def check_dataset_metrics(
         project_key, dataset_name
     )
 
-@mcp.tool()
+@_tool(cache=True)
 def get_dataset_post_write_statements(
     project_key: str,
     dataset_name: str
@@ -308,7 +660,7 @@ def get_dataset_post_write_statements(
     )
 
 # Register Scenario Tools
-@mcp.tool()
+@_tool()
 def create_scenario(
     project_key: str,
     scenario_name: str,
@@ -332,11 +684,11 @@ def create_scenario(
         scenario_type, definition,
     )
 
-@mcp.tool()
+@_tool()
 def update_scenario(
     project_key: str,
     scenario_id: str,
-    **kwargs: Any
+    updates: ScenarioUpdate
 ) -> dict[str, Any]:
     """
     Update scenario settings.
@@ -344,16 +696,17 @@ def update_scenario(
     Args:
         project_key: Dataiku project key, uppercase (e.g. 'DATAWAREHOUSE')
         scenario_id: Scenario identifier (e.g. 'REBUILD_DW')
-        **kwargs: Scenario settings to update
+        updates: Fields to update (name, description, active, tags,
+            custom_fields, definition, step_script, step_index)
 
     Returns:
         Dict with update status
     """
     return scenarios.update_scenario(
-        project_key, scenario_id, **kwargs
+        project_key, scenario_id, **updates
     )
 
-@mcp.tool()
+@_tool()
 def delete_scenario(
     project_key: str,
     scenario_id: str
@@ -372,12 +725,12 @@ def delete_scenario(
         project_key, scenario_id
     )
 
-@mcp.tool()
+@_tool()
 def add_scenario_trigger(
     project_key: str,
     scenario_id: str,
     trigger_type: str,
-    **params: Any
+    params: TriggerParams | None = None
 ) -> dict[str, Any]:
     """
     Add a trigger to a scenario (time-based, dataset change, etc.).
@@ -385,19 +738,21 @@ def add_scenario_trigger(
     Args:
         project_key: Dataiku project key, uppercase (e.g. 'DATAWAREHOUSE')
         scenario_id: Scenario identifier
-        trigger_type: Trigger type ('temporal',
-            'dataset_modified', 'sql_query', etc.)
-        **params: Trigger-specific parameters (cron, dataset name, etc.)
+        trigger_type: Trigger type ('periodic', 'hourly', 'daily',
+            'monthly', 'dataset')
+        params: Trigger-specific settings, e.g. every_minutes for
+            'periodic', hour/minute for 'daily', dataset_name (and
+            optional dataset_project_key) for 'dataset'
 
     Returns:
         Dict with trigger addition status
     """
     return scenarios.add_scenario_trigger(
         project_key, scenario_id,
-        trigger_type, **params,
+        trigger_type, **(params or {}),
     )
 
-@mcp.tool()
+@_tool()
 def remove_scenario_trigger(
     project_key: str,
     scenario_id: str,
@@ -418,7 +773,7 @@ def remove_scenario_trigger(
         project_key, scenario_id, trigger_idx
     )
 
-@mcp.tool()
+@_tool()
 def run_scenario(
     project_key: str,
     scenario_id: str
@@ -437,7 +792,7 @@ def run_scenario(
         project_key, scenario_id
     )
 
-@mcp.tool()
+@_tool()
 def get_scenario_info(
     project_key: str,
     scenario_id: str
@@ -456,7 +811,7 @@ def get_scenario_info(
         project_key, scenario_id
     )
 
-@mcp.tool()
+@_tool()
 def list_scenarios(
     project_key: str
 ) -> dict[str, Any]:
@@ -472,11 +827,14 @@ def list_scenarios(
     return scenarios.list_scenarios(project_key)
 
 # Register Advanced Scenario Tools
-@mcp.tool()
+@_tool()
 def get_scenario_logs(
     project_key: str,
     scenario_id: str,
-    run_id: str | None = None
+    run_id: str | None = None,
+    max_log_chars: int = 256 * 1024,
+    include_details: bool = True,
+    max_logs: int = 100
 ) -> dict[str, Any]:
     """
     Get detailed run logs for a scenario (useful for debugging failures).
@@ -485,15 +843,22 @@ def get_scenario_logs(
         project_key: Dataiku project key, uppercase (e.g. 'DATAWAREHOUSE')
         scenario_id: Scenario identifier
         run_id: Specific run ID (defaults to most recent run)
+        max_log_chars: Keep only the last N characters of each log;
+            truncated logs are flagged with "truncated": true
+        include_details: Set to false to skip step and job logs when the
+            run succeeded (only the scenario log is returned)
+        max_logs: Maximum number of logs returned (scenario log first,
+            then steps, then jobs); "logs_truncated" is true when capped
 
     Returns:
         Dict with log text, step outcomes, run status, and timing
     """
     return advanced_scenarios.get_scenario_logs(
-        project_key, scenario_id, run_id
+        project_key, scenario_id, run_id, max_log_chars,
+        include_details, max_logs
     )
 
-@mcp.tool()
+@_tool(cache=True)
 def get_scenario_steps(
     project_key: str,
     scenario_id: str
@@ -512,7 +877,7 @@ def get_scenario_steps(
         project_key, scenario_id
     )
 
-@mcp.tool()
+@_tool()
 def clone_scenario(
     project_key: str,
     source_scenario_id: str,
@@ -537,7 +902,7 @@ def clone_scenario(
     )
 
 # Register Code Development Tools
-@mcp.tool()
+@_tool(cache=True)
 def get_recipe_code(
     project_key: str,
     recipe_name: str
@@ -556,7 +921,7 @@ def get_recipe_code(
         project_key, recipe_name
     )
 
-@mcp.tool()
+@_tool(cache=True)
 def validate_recipe_syntax(
     project_key: str,
     recipe_name: str,
@@ -577,11 +942,12 @@ def validate_recipe_syntax(
         project_key, recipe_name, code
     )
 
-@mcp.tool()
+@_tool()
 def test_recipe_dry_run(
     project_key: str,
     recipe_name: str,
-    sample_rows: int = 100
+    sample_rows: int = 100,
+    include_sample_data: bool = False
 ) -> dict[str, Any]:
     """
     Test recipe logic on a sample without writing to the output dataset.
@@ -590,16 +956,18 @@ def test_recipe_dry_run(
         project_key: Dataiku project key, uppercase (e.g. 'DATAWAREHOUSE')
         recipe_name: Name of the recipe to test
         sample_rows: Number of input rows to sample (default 100)
+        include_sample_data: Set to true to read sample rows from each
+            input; by default inputs are checked through their schema
 
     Returns:
         Dict with sample output rows, schema, and any errors
     """
     return code_development.test_recipe_dry_run(
-        project_key, recipe_name, sample_rows
+        project_key, recipe_name, sample_rows, include_sample_data
     )
 
 # Register Project Exploration Tools
-@mcp.tool()
+@_tool(cache=True)
 def get_project_flow(
     project_key: str
 ) -> dict[str, Any]:
@@ -618,7 +986,7 @@ def get_project_flow(
         project_key
     )
 
-@mcp.tool()
+@_tool()
 def create_flow_zone(
     project_key: str,
     zone_name: str,
@@ -639,7 +1007,7 @@ def create_flow_zone(
         project_key, zone_name, color
     )
 
-@mcp.tool()
+@_tool()
 def list_flow_zones(project_key: str) -> dict[str, Any]:
     """
     List all flow zones in a project with metadata.
@@ -649,7 +1017,7 @@ def list_flow_zones(project_key: str) -> dict[str, Any]:
     """
     return project_exploration.list_flow_zones(project_key)
 
-@mcp.tool()
+@_tool()
 def get_flow_zone(project_key: str, zone_id: str) -> dict[str, Any]:
     """
     Get a specific flow zone's contents grouped by type.
@@ -659,7 +1027,7 @@ def get_flow_zone(project_key: str, zone_id: str) -> dict[str, Any]:
     """
     return project_exploration.get_flow_zone(project_key, zone_id)
 
-@mcp.tool()
+@_tool()
 def add_dataset_reference(
     project_key: str,
     source_project_key: str,
@@ -682,7 +1050,7 @@ def add_dataset_reference(
         project_key, source_project_key, dataset_name
     )
 
-@mcp.tool()
+@_tool()
 def move_to_zone(
     project_key: str,
     zone_id: str,
@@ -704,7 +1072,7 @@ def move_to_zone(
         project_key, zone_id, items
     )
 
-@mcp.tool()
+@_tool()
 def propagate_schema(
     project_key: str,
     dataset_name: str
@@ -723,7 +1091,7 @@ def propagate_schema(
         project_key, dataset_name
     )
 
-@mcp.tool()
+@_tool()
 def search_project_objects(
     project_key: str,
     search_term: str,
@@ -747,7 +1115,7 @@ def search_project_objects(
         project_key, search_term, object_types
     )
 
-@mcp.tool()
+@_tool()
 def get_dataset_sample(
     project_key: str,
     dataset_name: str,
@@ -771,7 +1139,7 @@ def get_dataset_sample(
     )
 
 # Register Environment Configuration Tools
-@mcp.tool()
+@_tool(cache=True)
 def get_code_environments(
     project_key: str | None = None
 ) -> dict[str, Any]:
@@ -789,7 +1157,7 @@ def get_code_environments(
         project_key
     )
 
-@mcp.tool()
+@_tool(cache=True)
 def get_project_variables(
     project_key: str
 ) -> dict[str, Any]:
@@ -806,7 +1174,7 @@ def get_project_variables(
         project_key
     )
 
-@mcp.tool()
+@_tool(cache=True)
 def get_connections(
     project_key: str | None = None
 ) -> dict[str, Any]:
@@ -825,7 +1193,7 @@ def get_connections(
     )
 
 # Register Monitoring and Debug Tools
-@mcp.tool()
+@_tool()
 def get_recent_runs(
     project_key: str,
     limit: int = 50,
@@ -846,7 +1214,7 @@ def get_recent_runs(
         project_key, limit, status_filter
     )
 
-@mcp.tool()
+@_tool()
 def get_job_details(
     project_key: str,
     job_id: str
@@ -866,7 +1234,7 @@ def get_job_details(
         project_key, job_id
     )
 
-@mcp.tool()
+@_tool()
 def cancel_running_jobs(
     project_key: str,
     job_ids: list[str]
@@ -886,7 +1254,7 @@ def cancel_running_jobs(
     )
 
 # Register Productivity Tools
-@mcp.tool()
+@_tool()
 def create_project(
     project_key: str,
     name: str,
@@ -907,7 +1275,7 @@ def create_project(
         project_key, name, description
     )
 
-@mcp.tool()
+@_tool()
 def duplicate_project_structure(
     source_project_key: str,
     target_project_key: str,
@@ -931,7 +1299,7 @@ def duplicate_project_structure(
         include_data,
     )
 
-@mcp.tool()
+@_tool()
 def export_project_config(
     project_key: str,
     format: str = "json"
@@ -944,13 +1312,15 @@ def export_project_config(
         format: Export format ('json' or 'yaml')
 
     Returns:
-        Dict with complete project configuration in the requested format
+        Dict with complete project configuration under "config"; YAML
+        exports also include the rendered text under "config_output"
+        and its length under export_stats "export_size"
     """
     return productivity.export_project_config(
         project_key, format
     )
 
-@mcp.tool()
+@_tool()
 def batch_update_objects(
     project_key: str,
     object_type: str,
@@ -982,8 +1352,39 @@ def list_available_projects() -> str:
     Returns:
         JSON string of available projects
     """
+    return _projects_json(tuple(list_projects()))
+
+@functools.lru_cache(maxsize=1)
+def _projects_json(project_keys: tuple[str, ...]) -> str:
+    """Serialize the project list, reusing the string while it is unchanged."""
+    return dumps({"projects": list(project_keys)})
+
+@mcp.resource("projects://page/{page}/{size}")
+def list_available_projects_page(page: str, size: str) -> str:
+    """
+    List one page of available Dataiku projects.
+
+    Args:
+        page: 1-based page number
+        size: Number of project keys per page
+
+    Returns:
+        JSON string with the page of projects and the total count
+    """
+    try:
+        page_number = max(1, int(page))
+        page_size = max(1, int(size))
+    except ValueError:
+        return dumps({"error": "page and size must be integers"})
+
     projects = list_projects()
-    return json.dumps({"projects": projects})
+    start = (page_number - 1) * page_size
+    return dumps({
+        "projects": projects[start:start + page_size],
+        "page": page_number,
+        "size": page_size,
+        "total": len(projects),
+    })
 
 # Add resource for project info
 @mcp.resource("project://{project_key}")
@@ -998,19 +1399,53 @@ def get_project_info(project_key: str) -> str:
         JSON string of project information
     """
     try:
-        project = get_project(project_key)
-        project_info = {
-            "key": project_key,
-            "name": project.get_metadata()["name"],
-            "description": project.get_metadata().get(
-                "description", ""
-            ),
-        }
-        return json.dumps(project_info)
+        return dumps(_project_info(project_key))
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return dumps({"error": str(e)})
 
-@mcp.tool()
+@mcp.resource("projects://batch/{project_keys}")
+def get_projects_info(project_keys: str) -> str:
+    """
+    Get information about several projects in one read.
+
+    Args:
+        project_keys: Comma-separated project keys (e.g. 'SALES,FINANCE')
+
+    Returns:
+        JSON string mapping each project key to its information
+    """
+    keys = [key.strip() for key in project_keys.split(",") if key.strip()]
+    if not keys:
+        return dumps({})
+
+    with ThreadPoolExecutor(max_workers=min(16, len(keys))) as executor:
+        results = list(executor.map(_project_info_or_error, keys))
+    return dumps(dict(zip(keys, results)))
+
+def _project_info(project_key: str) -> dict[str, Any]:
+    """Get project key, name and description, cached for DSS_META_TTL."""
+    return cached_metadata(
+        ("project_info", project_key),
+        lambda: _fetch_project_info(project_key),
+    )
+
+def _project_info_or_error(project_key: str) -> dict[str, Any]:
+    """Get project info, or an error entry if it cannot be retrieved."""
+    try:
+        return _project_info(project_key)
+    except Exception as e:
+        return {"error": str(e)}
+
+def _fetch_project_info(project_key: str) -> dict[str, Any]:
+    """Fetch project metadata from DSS."""
+    metadata = get_project(project_key).get_metadata()
+    return {
+        "key": project_key,
+        "name": metadata["name"],
+        "description": metadata.get("description", ""),
+    }
+
+@_tool()
 def set_project_variables(
     project_key: str,
     standard: dict[str, Any] | None = None,
@@ -1032,7 +1467,7 @@ def set_project_variables(
     return environment_config.set_project_variables(project_key, standard, local, merge)
 
 # Register Managed Folder Tools
-@mcp.tool()
+@_tool()
 def list_managed_folders(project_key: str) -> dict[str, Any]:
     """
     List all managed folders in a project.
@@ -1045,7 +1480,7 @@ def list_managed_folders(project_key: str) -> dict[str, Any]:
     """
     return managed_folders.list_managed_folders(project_key)
 
-@mcp.tool()
+@_tool()
 def get_managed_folder_contents(project_key: str, folder_id: str, path: str = "/") -> dict[str, Any]:
     """
     List files and subdirectories in a managed folder.
@@ -1060,7 +1495,7 @@ def get_managed_folder_contents(project_key: str, folder_id: str, path: str = "/
     """
     return managed_folders.get_managed_folder_contents(project_key, folder_id, path)
 
-@mcp.tool()
+@_tool()
 def get_managed_folder_info(project_key: str, folder_id: str) -> dict[str, Any]:
     """
     Get settings and metadata for a managed folder.
@@ -1074,7 +1509,7 @@ def get_managed_folder_info(project_key: str, folder_id: str) -> dict[str, Any]:
     """
     return managed_folders.get_managed_folder_info(project_key, folder_id)
 
-@mcp.tool()
+@_tool()
 def upload_file_to_folder(project_key: str, folder_id: str, path: str, content: str, is_base64: bool = False) -> dict[str, Any]:
     """
     Upload content to a file in a managed folder.
@@ -1091,7 +1526,7 @@ def upload_file_to_folder(project_key: str, folder_id: str, path: str, content:
     """
     return managed_folders.upload_file_to_folder(project_key, folder_id, path, content, is_base64)
 
-@mcp.tool()
+@_tool()
 def download_file_from_folder(project_key: str, folder_id: str, path: str, max_size_bytes: int = 1048576) -> dict[str, Any]:
     """
     Download a file from a managed folder.
@@ -1110,7 +1545,7 @@ def download_file_from_folder(project_key: str, folder_id: str, path: str, max_s
     """
     return managed_folders.download_file_from_folder(project_key, folder_id, path, max_size_bytes)
 
-@mcp.tool()
+@_tool()
 def delete_file_from_folder(project_key: str, folder_id: str, path: str) -> dict[str, Any]:
     """
     Delete a file from a managed folder.
@@ -1125,80 +1560,77 @@ def delete_file_from_folder(project_key: str, folder_id: str, path: str) -> dict
     """
     return managed_folders.delete_file_from_folder(project_key, folder_id, path)
 
-# Register Deployment Tools
-@mcp.tool()
-def list_api_deployer_services() -> dict[str, Any]:
-    """List all services in the API Deployer."""
-    return deployment.list_api_deployer_services()
-
-@mcp.tool()
-def list_api_deployer_deployments(service_id: str | None = None) -> dict[str, Any]:
-    """List deployments in the API Deployer."""
-    return deployment.list_api_deployer_deployments(service_id)
-
-@mcp.tool()
-def list_api_deployer_infras() -> dict[str, Any]:
-    """List infrastructures in the API Deployer."""
-    return deployment.list_api_deployer_infras()
-
-@mcp.tool()
-def get_api_deployment_status(deployment_id: str) -> dict[str, Any]:
-    """Get status of a specific API deployment."""
-    return deployment.get_api_deployment_status(deployment_id)
-
-@mcp.tool()
-def list_project_deployer_projects() -> dict[str, Any]:
-    """List all projects in the Project Deployer."""
-    return deployment.list_project_deployer_projects()
-
-@mcp.tool()
-def list_project_deployer_deployments(published_project_key: str | None = None) -> dict[str, Any]:
-    """List deployments in the Project Deployer."""
-    return deployment.list_project_deployer_deployments(published_project_key)
-
-@mcp.tool()
-def list_project_deployer_infras() -> dict[str, Any]:
-    """List infrastructures in the Project Deployer."""
-    return deployment.list_project_deployer_infras()
-
-@mcp.tool()
-def get_project_deployment_status(deployment_id: str) -> dict[str, Any]:
-    """Get status of a specific project deployment."""
-    return deployment.get_project_deployment_status(deployment_id)
-
-# Register Data Quality Tools
-@mcp.tool()
-def list_data_quality_rules(project_key: str, dataset_name: str) -> dict[str, Any]:
-    """List all data quality rules for a dataset."""
-    return data_quality.list_data_quality_rules(project_key, dataset_name)
-
-@mcp.tool()
-def get_data_quality_status(project_key: str, dataset_name: str) -> dict[str, Any]:
-    """Get the current pass/fail status of data quality rules."""
-    return data_quality.get_data_quality_status(project_key, dataset_name)
-
-@mcp.tool()
-def get_data_quality_results(project_key: str, dataset_name: str) -> dict[str, Any]:
-    """Get the last computed data quality rule results."""
-    return data_quality.get_data_quality_results(project_key, dataset_name)
-
-@mcp.tool()
-def compute_data_quality_rules(project_key: str, dataset_name: str) -> dict[str, Any]:
-    """Trigger computation of data quality rules for a dataset."""
-    return data_quality.compute_data_quality_rules(project_key, dataset_name)
-
-@mcp.tool()
-def create_data_quality_rule(project_key: str, dataset_name: str, rule_config: dict[str, Any]) -> dict[str, Any]:
-    """Create a new data quality rule on a dataset."""
-    return data_quality.create_data_quality_rule(project_key, dataset_name, rule_config)
-
-@mcp.tool()
-def delete_data_quality_rule(project_key: str, dataset_name: str, rule_id: str) -> dict[str, Any]:
-    """Delete a data quality rule from a dataset."""
-    return data_quality.delete_data_quality_rule(project_key, dataset_name, rule_id)
+# Register pass-through tools. These implementations already expose the
+# exact MCP signature, so they are registered directly without a wrapper.
+# That needs the function objects at registration time, so unlike the
+# _LazyToolModule modules above these are imported eagerly. They only
+# depend on typing, json, re and dataiku_mcp.client (already loaded), so
+# importing them costs next to nothing.
+_DIRECT_TOOLS: dict[str, tuple[tuple[str, str], ...]] = {
+    "deployment": (
+        ("list_api_deployer_services",
+         "List all services in the API Deployer."),
+        ("list_api_deployer_deployments",
+         "List deployments in the API Deployer."),
+        ("list_api_deployer_infras",
+         "List infrastructures in the API Deployer."),
+        ("get_api_deployment_status",
+         "Get status of a specific API deployment."),
+        ("list_project_deployer_projects",
+         "List all projects in the Project Deployer."),
+        ("list_project_deployer_deployments",
+         "List deployments in the Project Deployer."),
+        ("list_project_deployer_infras",
+         "List infrastructures in the Project Deployer."),
+        ("get_project_deployment_status",
+         "Get status of a specific project deployment."),
+    ),
+    "data_quality": (
+        ("list_data_quality_rules",
+         "List all data quality rules for a dataset."),
+        ("get_data_quality_status",
+         "Get the current pass/fail status of data quality rules."),
+        ("get_data_quality_results",
+         "Get the last computed data quality rule results."),
+        ("compute_data_quality_rules",
+         "Trigger computation of data quality rules for a dataset."),
+        ("create_data_quality_rule",
+         "Create a new data quality rule on a dataset."),
+        ("delete_data_quality_rule",
+         "Delete a data quality rule from a dataset."),
+    ),
+    "sql_execution": (
+        ("list_sql_connections",
+         "List DSS connections that support SQL execution."),
+    ),
+    "administration": (
+        ("get_instance_info",
+         "Get DSS instance information: version, node type, license."),
+        ("get_general_settings_summary",
+         "Get non-sensitive general DSS settings. "
+         "Sensitive values are masked."),
+        ("get_global_variables",
+         "Get global DSS variables. Sensitive values are masked."),
+        ("get_global_usage_summary",
+         "Get DSS instance usage summary: project, user, dataset counts."),
+        ("list_dss_logs",
+         "List available DSS log files."),
+        ("get_dss_log",
+         "Get content of a specific DSS log file (tail)."),
+        ("log_custom_audit",
+         "Write a custom audit log entry."),
+    ),
+}
+
+for _module_name, _tool_specs in _DIRECT_TOOLS.items():
+    _module = importlib.import_module(f"dataiku_mcp.tools.{_module_name}")
+    for _tool_name, _description in _tool_specs:
+        _tool(name=_tool_name, description=_description)(
+            getattr(_module, _tool_name)
+        )
 
 # Register SQL Execution Tools
-@mcp.tool()
+@_tool()
 def execute_sql_query(query: str, connection: str, database: str | None = None, query_type: str = "sql", max_rows: int = 10000) -> dict[str, Any]:
     """
     Execute a read-only SQL query through a DSS connection.
@@ -1217,48 +1649,224 @@ def execute_sql_query(query: str, connection: str, database: str | None = None,
     """
     return sql_execution.execute_sql_query(query, connection, database, query_type, max_rows)
 
-@mcp.tool()
-def list_sql_connections() -> dict[str, Any]:
-    """List DSS connections that support SQL execution."""
-    return sql_execution.list_sql_connections()
+# Register Batch Tools
+def dispatch_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """
+    Call a registered tool by name from inside the server process.
 
-# Register Administration Tools
-@mcp.tool()
-def get_instance_info() -> dict[str, Any]:
-    """Get DSS instance information: version, node type, license."""
-    return administration.get_instance_info()
+    Goes straight to the registered function, skipping FastMCP's request
+    routing. Arguments are validated against the tool's argument model,
+    which is built once when the tool is registered.
 
-@mcp.tool()
-def get_general_settings_summary() -> dict[str, Any]:
-    """Get non-sensitive general DSS settings. Sensitive values are masked."""
-    return administration.get_general_settings_summary()
+    Args:
+        tool_name: Registered tool name
+        arguments: Keyword arguments for the tool
 
-@mcp.tool()
-def get_global_variables() -> dict[str, Any]:
-    """Get global DSS variables. Sensitive values are masked."""
-    return administration.get_global_variables()
+    Returns:
+        The tool's result dict
+
+    Raises:
+        KeyError: If no tool is registered under that name
+        pydantic.ValidationError: If the arguments don't match the tool
+    """
+    fn = _TOOL_REGISTRY[tool_name]
+    meta = _TOOL_ARGS[tool_name]
+    parsed = meta.arg_model.model_validate(meta.pre_parse_json(arguments))
+    return fn(**parsed.model_dump_one_level())
+
+class BatchCall(BaseModel):
+    """One entry of a batch_call request."""
+
+    tool: str
+    args: dict[str, Any] = Field(default_factory=dict)
+    depends_on: list[int] = Field(default_factory=list)
+    bind: dict[str, str] = Field(default_factory=dict)
+
+_BIND_REF = re.compile(r"^\$(\d+)((?:\.[^.]+)*)$")
+
+def _parse_binding(ref: str) -> tuple[int, list[str]]:
+    """Split a "$N.field.subfield" reference into (N, path)."""
+    match = _BIND_REF.match(ref)
+    if match is None:
+        raise ValueError(
+            f"invalid binding '{ref}', expected '$<index>.<field>'"
+        )
+    path = match.group(2).split(".")[1:]
+    return int(match.group(1)), path
+
+def _batch_dependencies(index: int, call: BatchCall) -> list[int]:
+    """Indices of earlier calls this call waits for, explicit or bound."""
+    deps = set(call.depends_on)
+    deps.update(_parse_binding(ref)[0] for ref in call.bind.values())
+    for dep in deps:
+        if not 0 <= dep < index:
+            raise ValueError(
+                f"call {index} can only depend on earlier calls, got {dep}"
+            )
+    return sorted(deps)
+
+def _resolve_binding(ref: str, results: dict[int, dict[str, Any]]) -> Any:
+    """Look up a "$N.field.subfield" reference in earlier results."""
+    dep, path = _parse_binding(ref)
+    value: Any = results[dep]
+    for part in path:
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif (
+            isinstance(value, list)
+            and part.isdigit()
+            and int(part) < len(value)
+        ):
+            value = value[int(part)]
+        else:
+            raise ValueError(
+                f"binding '{ref}' not found in result of call {dep}"
+            )
+    return value
+
+async def _run_batch_item(
+    index: int,
+    call: BatchCall,
+    earlier: list[asyncio.Task],
+    semaphore: asyncio.Semaphore,
+) -> dict[str, Any]:
+    """
+    Run a single batch_call entry, converting failures to error dicts.
 
-@mcp.tool()
-def get_global_usage_summary() -> dict[str, Any]:
-    """Get DSS instance usage summary: project, user, dataset counts."""
-    return administration.get_global_usage_summary()
+    Waits for the calls it depends on (without holding a batch slot),
+    then fills its bound arguments from their results. Dependencies run
+    regardless of whether earlier calls succeeded, since error results
+    (e.g. a failed run_recipe) still carry ids worth following up on.
+    """
+    if call.tool not in _TOOL_REGISTRY:
+        return {"status": "error", "message": f"Unknown tool: {call.tool}"}
+    try:
+        deps = _batch_dependencies(index, call)
+    except ValueError as e:
+        return {"status": "error", "message": f"Skipped: {e}"}
+
+    args = call.args
+    if deps:
+        parent_results = {dep: await earlier[dep] for dep in deps}
+        try:
+            args = {
+                **call.args,
+                **{
+                    name: _resolve_binding(ref, parent_results)
+                    for name, ref in call.bind.items()
+                },
+            }
+        except ValueError as e:
+            return {"status": "error", "message": f"Skipped: {e}"}
+
+    async with semaphore, _INFLIGHT:
+        try:
+            return await anyio.to_thread.run_sync(
+                functools.partial(dispatch_tool, call.tool, args)
+            )
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Tool '{call.tool}' failed: {str(e)}",
+            }
+
+@mcp.tool()
+async def batch_call(
+    calls: list[BatchCall],
+    max_parallel: int = 8
+) -> dict[str, Any]:
+    """
+    Run several tool calls concurrently in one request.
 
-@mcp.tool()
-def list_dss_logs(max_logs: int = 50) -> dict[str, Any]:
-    """List available DSS log files."""
-    return administration.list_dss_logs(max_logs)
+    Use this to fan out lookups or bulk edits (e.g. inspect_dataset_schema
+    on many datasets). Independent calls run in parallel. A call can wait
+    for earlier calls with "depends_on" and take arguments from their
+    results with "bind", e.g. run a recipe and then fetch its job details:
 
-@mcp.tool()
-def get_dss_log(log_name: str, max_lines: int = 500) -> dict[str, Any]:
-    """Get content of a specific DSS log file (tail)."""
-    return administration.get_dss_log(log_name, max_lines)
+        [{"tool": "run_recipe",
+          "args": {"project_key": "X", "recipe_name": "compute_y"}},
+         {"tool": "get_job_details",
+          "args": {"project_key": "X"},
+          "bind": {"job_id": "$0.job_id"}}]
+
+    A call whose bound field is missing from the earlier result is
+    skipped with an error.
+
+    Args:
+        calls: List of calls, each {"tool": "<tool name>", "args": {...}}
+            with optional "depends_on": [<earlier call index>, ...] and
+            "bind": {"<arg name>": "$<call index>.<result field>"}
+        max_parallel: Maximum number of calls in flight at once (1-32)
+
+    Returns:
+        Dict with one result per call, in the same order as `calls`
+    """
+    semaphore = asyncio.Semaphore(
+        max(1, min(max_parallel, _BATCH_MAX_PARALLEL))
+    )
+    tasks: list[asyncio.Task] = []
+    for index, call in enumerate(calls):
+        tasks.append(asyncio.ensure_future(
+            _run_batch_item(index, call, tasks, semaphore)
+        ))
+    results = await asyncio.gather(*tasks)
+    return {"status": "ok", "count": len(results), "results": list(results)}
+
+# Project keys whose handle and info are loaded at startup
+# (comma-separated DSS_WARM_PROJECTS)
+_WARM_PROJECTS = tuple(
+    key.strip()
+    for key in os.environ.get("DSS_WARM_PROJECTS", "").split(",")
+    if key.strip()
+)
+
+
+def _prewarm():
+    """
+    Open the DSS connection and prime the project list cache, plus the
+    handle and info of each DSS_WARM_PROJECTS project.
+    """
+    try:
+        list_projects()
+    except Exception as e:
+        logger.warning("DSS prewarm failed: %s", e)
+        return
+    for project_key in _WARM_PROJECTS:
+        try:
+            _project_info(project_key)
+        except Exception as e:
+            logger.warning("Failed to prewarm project %s: %s", project_key, e)
+
+
+def _warm_tools():
+    """Import all lazily loaded tool modules ahead of their first call."""
+    for module in _LAZY_TOOL_MODULES:
+        try:
+            module.load()
+        except Exception as e:
+            logger.warning("Failed to preload %s: %s", module._name, e)
 
-@mcp.tool()
-def log_custom_audit(audit_type: str, details: dict[str, Any]) -> dict[str, Any]:
-    """Write a custom audit log entry."""
-    return administration.log_custom_audit(audit_type, details)
+
+def _warm_up(prewarm_dss: bool):
+    """Background startup work: optional DSS prewarm, then tool imports."""
+    if prewarm_dss:
+        _prewarm()
+    _warm_tools()
 
 
 def create_server():
-    """Create and configure the MCP server."""
+    """
+    Create and configure the MCP server.
+
+    Tool modules are imported in a background thread so the first call to
+    each one does not pay for it. With DSS_PREWARM=1 (implied by
+    DSS_WARM_PROJECTS), the DSS connection (DNS, TLS, connection probe)
+    is established first in the same thread.
+    """
+    prewarm_dss = (
+        os.environ.get("DSS_PREWARM") == "1" or bool(_WARM_PROJECTS)
+    )
+    threading.Thread(
+        target=_warm_up, args=(prewarm_dss,), daemon=True
+    ).start()
     return mcp
@@ -2,16 +2,82 @@
 Advanced scenario management tools for Dataiku MCP.
 """
 
-import copy
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from dataiku_mcp.client import get_project, get_project_for_write
 
+# Upper bound on log requests sent to DSS at once by get_scenario_logs
+_LOG_FETCH_WORKERS = 10
+
+# Step outcomes after which a step's log and jobs are complete
+_TERMINAL_OUTCOMES = frozenset({"SUCCESS", "WARNING", "FAILED", "ABORTED"})
+
+
+def _fetch_all(
+    fetchers: list[Callable[[], Any]],
+) -> list[tuple[Any, Exception | None]]:
+    """
+    Call each fetcher concurrently.
+
+    Returns:
+        (result, None) or (None, exception) per fetcher, in input order
+    """
+    def fetch(fn):
+        try:
+            return fn(), None
+        except Exception as e:
+            return None, e
+
+    if len(fetchers) <= 1:
+        return [fetch(fn) for fn in fetchers]
+    with ThreadPoolExecutor(
+        max_workers=min(_LOG_FETCH_WORKERS, len(fetchers))
+    ) as pool:
+        return list(pool.map(fetch, fetchers))
+
+
+def _log_entry(
+    log_type: str,
+    error_type: str,
+    label: str,
+    fields: dict[str, Any],
+    log: str | None,
+    error: Exception | None,
+    timestamp: Any,
+    max_log_chars: int,
+) -> dict[str, Any] | None:
+    """Build one get_scenario_logs entry; None for an empty log."""
+    if error is not None:
+        return {
+            "type": error_type,
+            **fields,
+            "content": f"Could not retrieve {label}: {str(error)}",
+            "timestamp": timestamp
+        }
+    if not log:
+        return None
+    entry = {
+        "type": log_type,
+        **fields,
+        "content": log,
+        "timestamp": timestamp
+    }
+    if len(log) > max_log_chars:
+        entry["content"] = log[-max_log_chars:]
+        entry["truncated"] = True
+    return entry
+
 
 def get_scenario_logs(
     project_key: str,
     scenario_id: str,
-    run_id: str | None = None
+    run_id: str | None = None,
+    max_log_chars: int = 256 * 1024,
+    include_details: bool = True,
+    max_logs: int = 100
 ) -> dict[str, Any]:
     """
     Get detailed run logs and error messages.
@@ -20,201 +86,166 @@ def get_scenario_logs(
         project_key: The project key
         scenario_id: ID of the scenario
         run_id: Specific run ID (defaults to latest)
+        max_log_chars: Maximum characters kept per log; longer logs
+            keep their end, where errors are reported
+        include_details: Fetch step and job logs even when the run
+            succeeded (they are always fetched for other outcomes)
+        max_logs: Maximum number of logs fetched; the scenario log
+            comes first, then step logs, then job logs
 
     Returns:
         Dict containing logs and run information
     """
+    if max_log_chars < 1:
+        return {
+            "status": "error",
+            "message": "max_log_chars must be at least 1"
+        }
+    if max_logs < 1:
+        return {
+            "status": "error",
+            "message": "max_logs must be at least 1"
+        }
+
     try:
         project = get_project(project_key)
         scenario = project.get_scenario(scenario_id)
 
-        # Get run history
-        runs = scenario.get_last_runs(limit=50)
-
-        if not runs:
-            return {
-                "status": "ok",
-                "message": (
-                    "No runs found for this scenario"
-                ),
-                "logs": [],
-                "run_info": {}
-            }
-
-        # Find the target run
-        target_run = None
+        # Look up the requested run directly; otherwise only the
+        # latest run is needed
         if run_id:
-            target_run = next(
-                (
-                    run for run in runs
-                    if getattr(run, 'id', None)
-                    == run_id
-                ),
-                None
-            )
-            if not target_run:
+            try:
+                target_run = scenario.get_run(run_id)
+            except Exception as e:
                 return {
                     "status": "error",
                     "message": (
-                        f"Run ID '{run_id}' not found"
+                        f"Run ID '{run_id}' not found: {str(e)}"
                     )
                 }
         else:
-            # Use the latest run
+            runs = scenario.get_last_runs(limit=1)
+            if not runs:
+                return {
+                    "status": "ok",
+                    "message": (
+                        "No runs found for this scenario"
+                    ),
+                    "logs": [],
+                    "run_info": {}
+                }
             target_run = runs[0]
 
-        # Extract run information
-        trigger = (
-            target_run.trigger_type
-            if hasattr(target_run, 'trigger_type')
-            else "unknown"
-        )
+        # Extract run information from the raw run dict (no request);
+        # end time and outcome are absent while the run is in progress
+        info = target_run.get_info()
+        start_time = target_run.start_time
         run_info = {
-            "run_id": getattr(
-                target_run, 'id', 'unknown'
+            "run_id": info.get("runId", "unknown"),
+            "start_time": start_time,
+            "end_time": (
+                target_run.end_time
+                if info.get("end", 0) > 0
+                else None
             ),
-            "start_time": target_run.start_time,
-            "end_time": target_run.end_time,
-            "outcome": target_run.outcome,
+            "outcome": info.get("result", {}).get("outcome"),
             "duration": target_run.duration,
-            "trigger": trigger
+            "trigger": (
+                info.get("trigger", {})
+                .get("trigger", {})
+                .get("type", "unknown")
+            )
         }
 
-        # Get logs from the run
-        logs = []
-
-        try:
-            # Get main scenario log
-            main_log = target_run.get_log()
-            if main_log:
-                logs.append({
-                    "type": "scenario_log",
-                    "content": main_log,
-                    "timestamp": (
-                        target_run.start_time
-                    )
-                })
-        except Exception as e:
-            logs.append({
-                "type": "error",
-                "content": (
-                    "Could not retrieve scenario"
-                    f" log: {str(e)}"
-                ),
-                "timestamp": target_run.start_time
-            })
-
-        # Get step logs if available
+        # Every log to fetch, in output order: the scenario log, then
+        # each step's log, then the log of each job run by a step.
+        # Entries are (log type, error type, error label, fields, fetch).
+        pending = [(
+            "scenario_log", "error", "scenario log",
+            {}, target_run.get_log,
+        )]
+        details_errors = []
+
+        # Step and job logs rarely add anything for a successful run
+        # beyond the scenario log
+        step_runs = []
         try:
-            step_runs = target_run.get_step_runs()
-            for i, step_run in enumerate(step_runs):
-                try:
-                    step_log = step_run.get_log()
-                    if step_log:
-                        step_name = (
-                            step_run.step_name
-                            if hasattr(
-                                step_run,
-                                'step_name'
-                            )
-                            else f"Step {i}"
-                        )
-                        timestamp = (
-                            step_run.start_time
-                            if hasattr(
-                                step_run,
-                                'start_time'
-                            )
-                            else
-                            target_run.start_time
-                        )
-                        logs.append({
-                            "type": "step_log",
-                            "step_index": i,
-                            "step_name": step_name,
-                            "content": step_log,
-                            "timestamp": timestamp
-                        })
-                except Exception as e:
-                    logs.append({
-                        "type": "step_error",
-                        "step_index": i,
-                        "content": (
-                            "Could not retrieve"
-                            f" step log: {str(e)}"
-                        ),
-                        "timestamp": (
-                            target_run.start_time
-                        )
-                    })
+            if include_details or run_info["outcome"] != "SUCCESS":
+                step_runs = target_run.get_details().steps
         except Exception as e:
-            logs.append({
+            details_errors.append({
                 "type": "error",
                 "content": (
                     "Could not retrieve step"
                     f" runs: {str(e)}"
                 ),
-                "timestamp": target_run.start_time
+                "timestamp": start_time
             })
 
-        # Get job logs if available
-        try:
-            jobs = target_run.get_jobs()
-            for job in jobs:
-                try:
-                    job_log = job.get_log()
-                    if job_log:
-                        job_name = (
-                            job.job_name
-                            if hasattr(
-                                job, 'job_name'
-                            )
-                            else
-                            f"Job {job.job_id}"
-                        )
-                        timestamp = (
-                            job.start_time
-                            if hasattr(
-                                job, 'start_time'
-                            )
-                            else
-                            target_run.start_time
-                        )
-                        logs.append({
-                            "type": "job_log",
-                            "job_id": job.job_id,
-                            "job_name": job_name,
-                            "content": job_log,
-                            "timestamp": timestamp
-                        })
-                except Exception as e:
-                    logs.append({
-                        "type": "job_error",
-                        "job_id": job.job_id,
-                        "content": (
-                            "Could not retrieve"
-                            f" job log: {str(e)}"
+        job_ids = []
+        for i, step_run in enumerate(step_runs):
+            # Steps still running have no useful logs yet
+            outcome = step_run.get("result", {}).get("outcome")
+            if outcome not in _TERMINAL_OUTCOMES:
+                continue
+            step = step_run.get("step", {})
+            step_id = step.get("id")
+            if step_id:
+                pending.append((
+                    "step_log", "step_error", "step log",
+                    {
+                        "step_index": i,
+                        "step_name": (
+                            step.get("name") or f"Step {i}"
                         ),
-                        "timestamp": (
-                            target_run.start_time
-                        )
-                    })
-        except Exception as e:
-            logs.append({
-                "type": "error",
-                "content": (
-                    "Could not retrieve"
-                    f" jobs: {str(e)}"
-                ),
-                "timestamp": target_run.start_time
-            })
+                    },
+                    functools.partial(
+                        target_run.get_log, step_id=step_id
+                    ),
+                ))
+            job_ids.extend(
+                item["jobId"]
+                for item in step_run.get(
+                    "additionalReportItems", []
+                )
+                if item.get("type") == "JOB_EXECUTED"
+            )
+
+        for job_id in job_ids:
+            pending.append((
+                "job_log", "job_error", "job log",
+                {"job_id": job_id, "job_name": f"Job {job_id}"},
+                project.get_job(job_id).get_log,
+            ))
+
+        # Drop the logs past the cap before requesting them
+        logs_truncated = len(pending) > max_logs
+        if logs_truncated:
+            del pending[max_logs:]
+
+        # Fetch the logs concurrently; each is a separate DSS request
+        fetched = _fetch_all([entry[4] for entry in pending])
+        entries = (
+            _log_entry(
+                log_type, error_type, label, fields,
+                log, error, start_time, max_log_chars,
+            )
+            for (log_type, error_type, label, fields, _), (log, error)
+            in zip(pending, fetched)
+        )
+        logs = [entry for entry in entries if entry is not None]
+        logs.extend(details_errors)
 
         return {
             "status": "ok",
             "scenario_id": scenario_id,
             "run_info": run_info,
             "logs": logs,
-            "log_count": len(logs)
+            "log_count": len(logs),
+            "logs_truncated": logs_truncated,
+            "total_chars": sum(
+                len(entry["content"]) for entry in logs
+            )
         }
 
     except Exception as e:
@@ -227,6 +258,63 @@ def get_scenario_logs(
         }
 
 
+def _extract_python_step(
+    step_info: dict[str, Any],
+    params: dict[str, Any],
+):
+    """Add the Python code of a custom_python step."""
+    script = params.get("script", "")
+    step_info["code"] = script
+    step_info["code_lines"] = (
+        script.count('\n') + 1
+        if script else 0
+    )
+
+
+def _extract_build_step(
+    step_info: dict[str, Any],
+    params: dict[str, Any],
+):
+    """Add the items built by a build_flowitem step."""
+    items = params.get("items", [])
+    step_info["build_items"] = items
+    step_info["build_count"] = len(items)
+
+
+def _extract_invalidate_step(
+    step_info: dict[str, Any],
+    params: dict[str, Any],
+):
+    """Add the items of an invalidate_cache step."""
+    step_info["invalidate_items"] = params.get("items", [])
+
+
+def _extract_sync_hive_step(
+    step_info: dict[str, Any],
+    params: dict[str, Any],
+):
+    """Add the items of a sync_hive step."""
+    step_info["sync_items"] = params.get("items", [])
+
+
+def _extract_run_scenario_step(
+    step_info: dict[str, Any],
+    params: dict[str, Any],
+):
+    """Add the scenarios run by a run_scenario step."""
+    step_info["nested_scenarios"] = params.get("scenarioRuns", [])
+
+
+# Step type -> extractor adding type-specific info to get_scenario_steps
+_STEP_EXTRACTORS = {
+    "custom_python": _extract_python_step,
+    "build_flowitem": _extract_build_step,
+    "invalidate_cache": _extract_invalidate_step,
+    "sync_hive": _extract_sync_hive_step,
+    "run_scenario": _extract_run_scenario_step,
+}
+
+
 def get_scenario_steps(
     project_key: str,
     scenario_id: str
@@ -263,51 +351,13 @@ def get_scenario_steps(
                 "enabled": step.get(
                     "enabled", True
                 ),
-                "params": step.get("params", {})
+                "params": step.get("params") or {}
             }
 
             # Extract info based on step type
-            if step.get("type") == "custom_python":
-                # Extract Python code
-                script = step.get(
-                    "params", {}
-                ).get("script", "")
-                step_info["code"] = script
-                step_info["code_lines"] = (
-                    len(script.split('\n'))
-                    if script else 0
-                )
-
-            elif step.get("type") == "build_flowitem":
-                # Extract build step information
-                items = step.get(
-                    "params", {}
-                ).get("items", [])
-                step_info["build_items"] = items
-                step_info["build_count"] = len(items)
-
-            elif step.get("type") == "invalidate_cache":
-                # Extract cache invalidation info
-                items = step.get(
-                    "params", {}
-                ).get("items", [])
-                step_info["invalidate_items"] = items
-
-            elif step.get("type") == "sync_hive":
-                # Extract Hive sync information
-                items = step.get(
-                    "params", {}
-                ).get("items", [])
-                step_info["sync_items"] = items
-
-            elif step.get("type") == "run_scenario":
-                # Extract nested scenario run info
-                scenario_runs = step.get(
-                    "params", {}
-                ).get("scenarioRuns", [])
-                step_info["nested_scenarios"] = (
-                    scenario_runs
-                )
+            extractor = _STEP_EXTRACTORS.get(step_info["type"])
+            if extractor is not None:
+                extractor(step_info, step_info["params"])
 
             steps.append(step_info)
 
@@ -343,6 +393,33 @@ def get_scenario_steps(
         }
 
 
+def _apply_step_changes(
+    step: dict[str, Any],
+    step_changes: dict[str, Any],
+):
+    """Apply one clone_scenario step modification in place."""
+    params = step.setdefault("params", {})
+
+    # Update step parameters
+    if "params" in step_changes:
+        params.update(step_changes["params"])
+
+    # Update step code for custom_python steps
+    if (
+        "code" in step_changes
+        and step.get("type") == "custom_python"
+    ):
+        params["script"] = step_changes["code"]
+
+    # Update step name
+    if "name" in step_changes:
+        step["name"] = step_changes["name"]
+
+    # Update step enabled status
+    if "enabled" in step_changes:
+        step["enabled"] = step_changes["enabled"]
+
+
 def clone_scenario(
     project_key: str,
     source_scenario_id: str,
@@ -361,6 +438,45 @@ def clone_scenario(
     Returns:
         Dict containing cloned scenario information
     """
+    # Step and trigger indices arrive as strings when sent as JSON
+    # object keys. Normalize them before anything is created, so an
+    # invalid index cannot leave a half-configured clone behind
+    mods = modifications or {}
+    for field in ("step_modifications", "trigger_modifications"):
+        if not isinstance(mods.get(field, {}), dict):
+            return {
+                "status": "error",
+                "message": (
+                    f"{field} must be an object mapping"
+                    " indices to changes"
+                )
+            }
+    try:
+        step_mods = {
+            int(step_index): step_changes
+            for step_index, step_changes in (
+                mods.get("step_modifications", {}).items()
+            )
+        }
+        trigger_mods = {
+            int(trigger_index): trigger_changes
+            for trigger_index, trigger_changes in (
+                mods.get("trigger_modifications", {}).items()
+            )
+        }
+        remove_triggers = {
+            int(trigger_index)
+            for trigger_index in mods.get("remove_triggers", [])
+        }
+    except (TypeError, ValueError) as e:
+        return {
+            "status": "error",
+            "message": (
+                "Invalid step or trigger"
+                f" index: {str(e)}"
+            )
+        }
+
     try:
         project = get_project_for_write(project_key)
         source_scenario = project.get_scenario(
@@ -368,60 +484,42 @@ def clone_scenario(
         )
         source_settings = source_scenario.get_settings()
 
-        # Get source scenario configuration
-        source_scenario.get_metadata()
+        # Read what the clone needs from the source settings once. The
+        # settings object wraps the raw scenario dict, so none of this
+        # makes further requests
+        source_raw = source_settings.get_raw()
+        scenario_type = source_raw["type"]
+        step_based = scenario_type == "step_based"
 
         # Create new scenario
-        scenario_type = source_settings.type
         new_scenario = project.create_scenario(
-            new_scenario_name,
-            scenario_type,
-            definition=(
-                source_settings.get_definition()
-            )
+            new_scenario_name, scenario_type
         )
+        new_scenario_id = new_scenario.id
 
         # Get new scenario settings to modify
         new_settings = new_scenario.get_settings()
-
-        # Copy basic settings
-        new_settings.name = new_scenario_name
-        new_settings.active = source_settings.active
-
-        # Copy steps
-        new_settings.raw_steps = copy.deepcopy(
-            source_settings.raw_steps
-        )
-
-        # Copy triggers
-        new_settings.raw_triggers = copy.deepcopy(
-            source_settings.raw_triggers
-        )
+        new_settings.active = source_raw.get("active", False)
+
+        # Move steps (or the script) and triggers over. source_settings
+        # is a private copy fetched for this call and never saved, so
+        # its dicts can be handed to the clone and modified without
+        # copying (raw_steps/raw_triggers are read-only views of the
+        # settings data, so their contents are replaced in place)
+        if step_based:
+            new_settings.raw_steps[:] = source_settings.raw_steps
+        else:
+            new_settings.code = source_settings.code
+        new_settings.raw_triggers[:] = source_settings.raw_triggers
 
         # Apply modifications if provided
         if modifications:
-            # Modify metadata
-            if "description" in modifications:
-                new_metadata = (
-                    new_scenario.get_metadata()
-                )
-                new_metadata["description"] = (
-                    modifications["description"]
-                )
-                new_scenario.set_metadata(
-                    new_metadata
-                )
-
-            if "tags" in modifications:
-                new_metadata = (
-                    new_scenario.get_metadata()
-                )
-                new_metadata["tags"] = (
-                    modifications["tags"]
-                )
-                new_scenario.set_metadata(
-                    new_metadata
-                )
+            # Description and tags are part of the scenario settings,
+            # so they are written by the same save as everything else
+            raw_settings = new_settings.get_raw()
+            for key in ("description", "tags"):
+                if key in modifications:
+                    raw_settings[key] = modifications[key]
 
             # Modify settings
             if "active" in modifications:
@@ -429,112 +527,43 @@ def clone_scenario(
                     modifications["active"]
                 )
 
-            # Modify steps
-            if "step_modifications" in modifications:
-                step_mods = (
-                    modifications["step_modifications"]
-                )
-                for step_index, step_changes in (
-                    step_mods.items()
+            # Modify steps; indices past the last step are ignored
+            if step_based:
+                steps = new_settings.raw_steps
+                for i, step_changes in step_mods.items():
+                    if 0 <= i < len(steps):
+                        _apply_step_changes(steps[i], step_changes)
+
+            # Modify, remove and add triggers in one pass. Indices refer
+            # to the source scenario's triggers
+            if trigger_mods or remove_triggers or (
+                "new_triggers" in modifications
+            ):
+                triggers = []
+                for i, trigger in enumerate(
+                    new_settings.raw_triggers
                 ):
-                    if step_index < len(
-                        new_settings.raw_steps
-                    ):
-                        step = (
-                            new_settings
-                            .raw_steps[step_index]
-                        )
-
-                        # Update step parameters
-                        if "params" in step_changes:
-                            step["params"].update(
-                                step_changes["params"]
-                            )
-
-                        # Update step code for
-                        # custom_python steps
-                        is_python = (
-                            step.get("type")
-                            == "custom_python"
-                        )
-                        if (
-                            "code" in step_changes
-                            and is_python
-                        ):
-                            if "params" not in step:
-                                step["params"] = {}
-                            step["params"]["script"] = (
-                                step_changes["code"]
-                            )
-
-                        # Update step name
-                        if "name" in step_changes:
-                            step["name"] = (
-                                step_changes["name"]
-                            )
-
-                        # Update step enabled status
-                        if "enabled" in step_changes:
-                            step["enabled"] = (
-                                step_changes["enabled"]
-                            )
-
-            # Modify triggers
-            if "trigger_modifications" in modifications:
-                trigger_mods = (
-                    modifications[
-                        "trigger_modifications"
-                    ]
-                )
-                for trigger_index, trigger_changes in (
-                    trigger_mods.items()
-                ):
-                    if trigger_index < len(
-                        new_settings.raw_triggers
-                    ):
-                        trigger = (
-                            new_settings
-                            .raw_triggers[
-                                trigger_index
-                            ]
-                        )
-                        trigger.update(
-                            trigger_changes
-                        )
-
-            # Add new triggers
-            if "new_triggers" in modifications:
-                new_settings.raw_triggers.extend(
-                    modifications["new_triggers"]
+                    if i in remove_triggers:
+                        continue
+                    if i in trigger_mods:
+                        trigger.update(trigger_mods[i])
+                    triggers.append(trigger)
+                triggers.extend(
+                    modifications.get("new_triggers", [])
                 )
+                new_settings.raw_triggers[:] = triggers
 
-            # Remove triggers by index
-            if "remove_triggers" in modifications:
-                indices = sorted(
-                    modifications[
-                        "remove_triggers"
-                    ],
-                    reverse=True
-                )
-                for trigger_index in indices:
-                    if trigger_index < len(
-                        new_settings.raw_triggers
-                    ):
-                        del new_settings.raw_triggers[
-                            trigger_index
-                        ]
-
-        # Save the new scenario
+        # Save the new scenario in a single request
         new_settings.save()
 
         # Get final scenario info
         final_scenario_info = {
-            "id": new_scenario.scenario_id,
+            "id": new_scenario_id,
             "name": new_scenario_name,
             "type": scenario_type,
             "active": new_settings.active,
-            "step_count": len(
-                new_settings.raw_steps
+            "step_count": (
+                len(new_settings.raw_steps) if step_based else 0
             ),
             "trigger_count": len(
                 new_settings.raw_triggers
@@ -550,9 +579,7 @@ def clone_scenario(
             "source_scenario_id": (
                 source_scenario_id
             ),
-            "new_scenario_id": (
-                new_scenario.scenario_id
-            ),
+            "new_scenario_id": new_scenario_id,
             "new_scenario_name": (
                 new_scenario_name
             ),
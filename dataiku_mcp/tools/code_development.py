@@ -3,11 +3,100 @@ Code and recipe development tools for Dataiku MCP integration.
 """
 
 import ast
+import functools
+import itertools
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from dataiku_mcp.client import get_project
+from dataiku_mcp.serialization import dumps
+
+_SELECT_RE = re.compile(r'\bSELECT\b', re.IGNORECASE)
+
+# Dataiku API calls that read input or write output datasets
+_INPUT_READ_RE = re.compile(r'get_dataframe|iter_rows')
+_OUTPUT_WRITE_RE = re.compile(r'write_with_schema|write_dataframe')
+
+# Language of the code held by each code recipe type
+_RECIPE_LANGUAGE = {
+    "python": "python",
+    "pyspark": "python",
+    "r": "r",
+    "sparkr": "r",
+    "scala": "scala",
+    "spark_scala": "scala",
+    "sql": "sql",
+    "sql_script": "sql",
+    "sql_query": "sql",
+    "spark_sql_query": "sql",
+}
+
+# Upper bound on dataset checks sent to DSS at once by test_recipe_dry_run
+_DATASET_CHECK_WORKERS = 16
+
+
+def _line_count(code: str) -> int:
+    """Count the lines of code without splitting it."""
+    return code.count('\n') + 1 if code else 0
+
+
+def _tally_chars(code: str) -> dict[str, int]:
+    """
+    Count the delimiters and quotes checked by the SQL and R validators.
+
+    Each count is a C-level str.count; escaped quotes are not counted
+    as quotes.
+    """
+    counts = {char: code.count(char) for char in "()[]{}"}
+    counts["'"] = code.count("'") - code.count("\\'")
+    counts['"'] = code.count('"') - code.count('\\"')
+    return counts
+
+
+def _imports_dataiku(tree: ast.Module) -> bool:
+    """
+    Check parsed code for `import dataiku` or `from dataiku import`.
+
+    Only top-level statements and the bodies of top-level if/try blocks
+    are checked, which is where recipes import dataiku.
+    """
+    for node in tree.body:
+        nested = node.body if isinstance(node, (ast.If, ast.Try)) else []
+        for stmt in (node, *nested):
+            if isinstance(stmt, ast.Import):
+                if any(alias.name == "dataiku" for alias in stmt.names):
+                    return True
+            elif (
+                isinstance(stmt, ast.ImportFrom)
+                and stmt.module == "dataiku"
+            ):
+                return True
+    return False
+
+
+def _analyze_code(code: str) -> dict[str, bool]:
+    """Check whether Python recipe code reads inputs and writes outputs."""
+    return {
+        "has_input_read": bool(_INPUT_READ_RE.search(code)),
+        "has_output_write": bool(_OUTPUT_WRITE_RE.search(code)),
+    }
+
+
+def _load_recipe(project_key: str, recipe_name: str):
+    """
+    Fetch a recipe's settings with a single request.
+
+    The settings hold the recipe type, inputs, outputs and code, so no
+    other recipe request is needed.
+
+    Returns:
+        Tuple of (project, recipe settings)
+    """
+    project = get_project(project_key)
+    settings = project.get_recipe(recipe_name).get_settings()
+    return project, settings
 
 
 def get_recipe_code(
@@ -33,64 +122,34 @@ def get_recipe_code(
         Dict containing code and recipe information
     """
     try:
-        project = get_project(project_key)
-        recipe = project.get_recipe(recipe_name)
-        settings = recipe.get_settings()
-
-        # Get recipe metadata - try multiple methods
-        recipe_type = (
-            getattr(recipe, 'type', None) or "unknown"
-        )
-        inputs = []
-        outputs = []
-
-        try:
-            inputs = [
-                inp["ref"]
-                for inp in recipe.get_inputs()
-            ]
-            outputs = [
-                out["ref"]
-                for out in recipe.get_outputs()
-            ]
-        except Exception:
-            pass
+        _, settings = _load_recipe(project_key, recipe_name)
+        recipe_type = settings.type
+        recipe_params = settings.get_recipe_params() or {}
 
         recipe_info = {
             "name": recipe_name,
             "type": recipe_type,
-            "engine": settings.get_recipe_params().get(
-                "engine", "unknown"
-            ),
-            "inputs": inputs,
-            "outputs": outputs
+            "engine": recipe_params.get("engine", "unknown"),
+            "inputs": settings.get_flat_input_refs(),
+            "outputs": settings.get_flat_output_refs()
         }
 
         # Extract code using a priority-based approach
         code = ""
         code_info = {}
 
-        # 1. Try settings.get_code() - works for
-        # python, r, sql, pyspark, scala recipes
+        # 1. Try settings.get_code() - only code recipe
+        # settings (python, r, sql, pyspark, scala) have it
         try:
-            code = settings.get_code()
+            if hasattr(settings, "get_code"):
+                code = settings.get_code()
             if code:
-                if recipe_type in [
-                    "python", "r", "scala"
-                ]:
-                    language = recipe_type
-                elif recipe_type in ["sql", "pyspark"]:
-                    language = "sql"
-                else:
-                    language = "unknown"
-                if recipe_type == "pyspark":
-                    language = "python"
                 code_info = {
-                    "language": language,
-                    "source": "get_code",
-                    "line_count": len(
-                        code.split('\n')
+                    "language": _RECIPE_LANGUAGE.get(
+                        recipe_type, "unknown"
                     ),
+                    "source": "get_code",
+                    "line_count": _line_count(code),
                     "char_count": len(code)
                 }
         except Exception:
@@ -109,9 +168,7 @@ def get_recipe_code(
                     code_info = {
                         "language": "sql",
                         "source": "get_payload",
-                        "line_count": len(
-                            code.split('\n')
-                        ),
+                        "line_count": _line_count(code),
                         "char_count": len(code)
                     }
                 elif isinstance(payload, dict):
@@ -127,24 +184,21 @@ def get_recipe_code(
                         code_info = {
                             "language": "sql",
                             "source": "get_payload",
-                            "line_count": len(
-                                code.split('\n')
-                            ),
+                            "line_count": _line_count(code),
                             "char_count": len(code)
                         }
             except Exception:
                 pass
 
-        # 3. Fallback: return recipe_params as JSON
-        # config (for visual recipes or debugging)
+        # 3. Fallback: return recipe_params as compact
+        # JSON config (for visual recipes or debugging)
         if not code:
-            recipe_params = settings.get_recipe_params()
-            code = json.dumps(recipe_params, indent=2)
+            code = dumps(recipe_params)
             code_info = {
                 "language": "json",
                 "source": "get_recipe_params",
                 "type": "recipe_config",
-                "line_count": len(code.split('\n')),
+                "line_count": _line_count(code),
                 "char_count": len(code)
             }
 
@@ -183,13 +237,17 @@ def validate_recipe_syntax(
         Dict containing validation results
     """
     try:
-        project = get_project(project_key)
-        recipe = project.get_recipe(recipe_name)
+        _, settings = _load_recipe(project_key, recipe_name)
+        recipe_type = settings.type
 
-        # Get code to validate
+        # Get code to validate; visual recipes have no code,
+        # so their JSON payload is validated instead
         if code is None:
-            settings = recipe.get_settings()
-            code = settings.get_code()
+            code = (
+                settings.get_code()
+                if hasattr(settings, "get_code")
+                else settings.get_payload()
+            )
 
         if not code or not code.strip():
             return {
@@ -201,26 +259,11 @@ def validate_recipe_syntax(
                 "errors": []
             }
 
-        try:
-            recipe_definition = recipe.get_definition()
-            recipe_type = recipe_definition.get(
-                "type", "unknown"
-            )
-        except AttributeError:
-            # Fallback for older API versions
-            recipe_def_payload = (
-                recipe.get_definition_and_payload()
-            )
-            recipe_type = (
-                recipe_def_payload
-                .get_payload()
-                .get("type", "unknown")
-            )
         validation_results = {
             "recipe_name": recipe_name,
             "recipe_type": recipe_type,
             "code_length": len(code),
-            "line_count": len(code.split('\n'))
+            "line_count": _line_count(code)
         }
 
         errors = []
@@ -271,10 +314,8 @@ def validate_recipe_syntax(
                 })
 
             # Check for input/output dataset handling
-            if (
-                "get_dataframe" not in code
-                and "iter_rows" not in code
-            ):
+            code_analysis = _analyze_code(code)
+            if not code_analysis["has_input_read"]:
                 warnings.append({
                     "type": "no_input_handling",
                     "message": (
@@ -283,10 +324,7 @@ def validate_recipe_syntax(
                     )
                 })
 
-            if (
-                "write_with_schema" not in code
-                and "write_dataframe" not in code
-            ):
+            if not code_analysis["has_output_write"]:
                 warnings.append({
                     "type": "no_output_handling",
                     "message": (
@@ -295,13 +333,16 @@ def validate_recipe_syntax(
                     )
                 })
 
-        elif recipe_type == "sql":
+        elif recipe_type in ["sql", "sql_script", "sql_query"]:
             # SQL syntax validation (basic)
             sql_errors = []
+            counts = _tally_chars(code)
 
-            # Basic SQL syntax checks
-            if not re.search(
-                r'\bSELECT\b', code, re.IGNORECASE
+            # Basic SQL syntax checks. Only query recipes must
+            # select; SQL scripts legitimately run DDL/DML
+            if (
+                recipe_type == "sql_query"
+                and not _SELECT_RE.search(code)
             ):
                 sql_errors.append({
                     "type": "missing_select",
@@ -312,7 +353,7 @@ def validate_recipe_syntax(
                 })
 
             # Check for balanced parentheses
-            if code.count('(') != code.count(')'):
+            if counts['('] != counts[')']:
                 sql_errors.append({
                     "type": "unbalanced_parentheses",
                     "message": (
@@ -322,14 +363,7 @@ def validate_recipe_syntax(
                 })
 
             # Check for unterminated strings
-            single_quotes = (
-                code.count("'") - code.count("\\'")
-            )
-            double_quotes = (
-                code.count('"') - code.count('\\"')
-            )
-
-            if single_quotes % 2 != 0:
+            if counts["'"] % 2 != 0:
                 sql_errors.append({
                     "type": "unterminated_string",
                     "message": (
@@ -338,7 +372,7 @@ def validate_recipe_syntax(
                     )
                 })
 
-            if double_quotes % 2 != 0:
+            if counts['"'] % 2 != 0:
                 sql_errors.append({
                     "type": "unterminated_string",
                     "message": (
@@ -355,10 +389,11 @@ def validate_recipe_syntax(
         elif recipe_type == "r":
             # R syntax validation (basic)
             r_errors = []
+            counts = _tally_chars(code)
 
             # Check for balanced parentheses
             # and brackets
-            if code.count('(') != code.count(')'):
+            if counts['('] != counts[')']:
                 r_errors.append({
                     "type":
                         "unbalanced_parentheses",
@@ -368,7 +403,7 @@ def validate_recipe_syntax(
                     )
                 })
 
-            if code.count('[') != code.count(']'):
+            if counts['['] != counts[']']:
                 r_errors.append({
                     "type":
                         "unbalanced_brackets",
@@ -378,7 +413,7 @@ def validate_recipe_syntax(
                     )
                 })
 
-            if code.count('{') != code.count('}'):
+            if counts['{'] != counts['}']:
                 r_errors.append({
                     "type": "unbalanced_braces",
                     "message": (
@@ -430,10 +465,97 @@ def validate_recipe_syntax(
         }
 
 
+def _check_input(
+    project,
+    input_name: str,
+    sample_rows: int,
+    include_sample_data: bool
+) -> dict[str, Any]:
+    """Check that an input dataset is readable for test_recipe_dry_run."""
+    try:
+        input_dataset = project.get_dataset(input_name)
+        schema = input_dataset.get_schema()
+    except Exception as e:
+        return {
+            "name": input_name,
+            "status": "error",
+            "message": (
+                "Input dataset not "
+                f"accessible: {str(e)}"
+            )
+        }
+
+    schema_columns = schema["columns"] if schema else []
+    input_info = {
+        "name": input_name,
+        "status": "ok",
+        "schema_columns": len(schema_columns),
+        "sample_columns": [
+            col["name"] for col in schema_columns
+        ]
+    }
+    if not include_sample_data:
+        return input_info
+
+    # Try to read sample rows; closing the iterator closes the HTTP
+    # stream so the rest of the dataset is never downloaded.
+    # iter_rows() starts the request when called, so it goes
+    # inside the try
+    row_iter = None
+    try:
+        row_iter = input_dataset.iter_rows()
+        sample_count = sum(
+            1 for _ in itertools.islice(row_iter, sample_rows)
+        )
+    except Exception as e:
+        return {
+            "name": input_name,
+            "status": "warning",
+            "message": (
+                "Could not read sample"
+                f" data: {str(e)}"
+            ),
+            "schema_columns": len(schema_columns)
+        }
+    finally:
+        if row_iter is not None:
+            row_iter.close()
+
+    input_info["sample_rows"] = sample_count
+    return input_info
+
+
+def _check_output(project, output_name: str) -> dict[str, Any]:
+    """Check whether an output dataset exists for test_recipe_dry_run."""
+    try:
+        raw = (
+            project.get_dataset(output_name)
+            .get_settings()
+            .get_raw()
+        )
+        return {
+            "name": output_name,
+            "status": "ok",
+            "exists": True,
+            "type": raw["type"]
+        }
+    except Exception as e:
+        return {
+            "name": output_name,
+            "status": "warning",
+            "exists": False,
+            "message": (
+                "Output dataset will be "
+                f"created: {str(e)}"
+            )
+        }
+
+
 def test_recipe_dry_run(
     project_key: str,
     recipe_name: str,
-    sample_rows: int = 100
+    sample_rows: int = 100,
+    include_sample_data: bool = False
 ) -> dict[str, Any]:
     """
     Test recipe logic without actual execution.
@@ -442,51 +564,27 @@ def test_recipe_dry_run(
         project_key: The project key
         recipe_name: Name of the recipe
         sample_rows: Number of sample rows to test
+        include_sample_data: Read up to sample_rows rows of each input
+            (otherwise inputs are checked through their schema only)
 
     Returns:
         Dict containing test results
     """
+    # iter_rows() opens the HTTP stream at once; with no rows to read
+    # it would never be released
+    if include_sample_data and sample_rows < 1:
+        return {
+            "status": "error",
+            "message": "sample_rows must be at least 1"
+        }
+
     try:
-        project = get_project(project_key)
-        recipe = project.get_recipe(recipe_name)
-        settings = recipe.get_settings()
+        project, settings = _load_recipe(project_key, recipe_name)
 
         # Get recipe information
-        try:
-            recipe_def = recipe.get_definition()
-            inputs = [
-                inp["ref"]
-                for inp in recipe_def["inputs"]
-            ]
-            outputs = [
-                out["ref"]
-                for out in recipe_def["outputs"]
-            ]
-            recipe_type = recipe_def.get(
-                "type", "unknown"
-            )
-        except AttributeError:
-            # Fallback for older API versions
-            try:
-                recipe_def_payload = (
-                    recipe
-                    .get_definition_and_payload()
-                )
-                payload = (
-                    recipe_def_payload.get_payload()
-                )
-                if isinstance(payload, dict):
-                    recipe_type = payload.get(
-                        "type", "unknown"
-                    )
-                else:
-                    recipe_type = "unknown"
-                inputs = []
-                outputs = []
-            except Exception:
-                recipe_type = "unknown"
-                inputs = []
-                outputs = []
+        recipe_type = settings.type
+        inputs = settings.get_flat_input_refs()
+        outputs = settings.get_flat_output_refs()
         test_results = {
             "recipe_name": recipe_name,
             "recipe_type": recipe_type,
@@ -495,105 +593,30 @@ def test_recipe_dry_run(
             "sample_rows": sample_rows
         }
 
-        # Check if inputs exist and are accessible
-        input_checks = []
-        for input_name in inputs:
-            try:
-                input_dataset = project.get_dataset(
-                    input_name
-                )
-                schema = input_dataset.get_schema()
-
-                # Try to get sample data
-                try:
-                    sample_df = (
-                        input_dataset.get_dataframe(
-                            limit=sample_rows
-                        )
-                    )
-                    sample_cols = (
-                        list(sample_df.columns)
-                        if hasattr(
-                            sample_df, 'columns'
-                        )
-                        else []
-                    )
-                    input_info = {
-                        "name": input_name,
-                        "status": "ok",
-                        "schema_columns": len(
-                            schema["columns"]
-                        ),
-                        "sample_rows": len(
-                            sample_df
-                        ),
-                        "sample_columns":
-                            sample_cols
-                    }
-                except Exception as e:
-                    schema_cols = (
-                        len(schema["columns"])
-                        if schema
-                        else 0
-                    )
-                    input_info = {
-                        "name": input_name,
-                        "status": "warning",
-                        "message": (
-                            "Could not read sample"
-                            f" data: {str(e)}"
-                        ),
-                        "schema_columns":
-                            schema_cols
-                    }
-
-                input_checks.append(input_info)
-
-            except Exception as e:
-                input_checks.append({
-                    "name": input_name,
-                    "status": "error",
-                    "message": (
-                        "Input dataset not "
-                        f"accessible: {str(e)}"
-                    )
-                })
+        # Check inputs and outputs concurrently; each check is a
+        # separate DSS request
+        checks = [
+            functools.partial(
+                _check_input, project, name,
+                sample_rows, include_sample_data,
+            )
+            for name in inputs
+        ] + [
+            functools.partial(_check_output, project, name)
+            for name in outputs
+        ]
+        with ThreadPoolExecutor(
+            max_workers=max(
+                1, min(_DATASET_CHECK_WORKERS, len(checks))
+            )
+        ) as pool:
+            results = list(pool.map(lambda check: check(), checks))
+        input_checks = results[:len(inputs)]
+        output_checks = results[len(inputs):]
 
         test_results["input_checks"] = (
             input_checks
         )
-
-        # Check if outputs are properly configured
-        output_checks = []
-        for output_name in outputs:
-            try:
-                output_dataset = (
-                    project.get_dataset(output_name)
-                )
-                raw = (
-                    output_dataset
-                    .get_settings()
-                    .get_raw()
-                )
-                output_info = {
-                    "name": output_name,
-                    "status": "ok",
-                    "exists": True,
-                    "type": raw["type"]
-                }
-            except Exception as e:
-                output_info = {
-                    "name": output_name,
-                    "status": "warning",
-                    "exists": False,
-                    "message": (
-                        "Output dataset will be "
-                        f"created: {str(e)}"
-                    )
-                }
-
-            output_checks.append(output_info)
-
         test_results["output_checks"] = (
             output_checks
         )
@@ -608,51 +631,13 @@ def test_recipe_dry_run(
                 # basic structure
                 tree = ast.parse(code)
 
-                # Check for dataiku imports
-                has_dataiku_import = False
-                for node in ast.walk(tree):
-                    if isinstance(
-                        node, ast.Import
-                    ):
-                        for alias in node.names:
-                            if (
-                                alias.name
-                                == "dataiku"
-                            ):
-                                has_dataiku_import = (
-                                    True
-                                )
-                    elif isinstance(
-                        node, ast.ImportFrom
-                    ):
-                        if (
-                            node.module
-                            == "dataiku"
-                        ):
-                            has_dataiku_import = (
-                                True
-                            )
-
-                # Check for dataset operations
-                has_input_read = (
-                    "get_dataframe" in code
-                    or "iter_rows" in code
-                )
-                has_output_write = (
-                    "write_with_schema" in code
-                    or "write_dataframe" in code
-                )
-
+                # Check for dataiku imports and
+                # dataset operations
                 code_analysis = {
                     "has_dataiku_import":
-                        has_dataiku_import,
-                    "has_input_read":
-                        has_input_read,
-                    "has_output_write":
-                        has_output_write,
-                    "line_count": len(
-                        code.split('\n')
-                    ),
+                        _imports_dataiku(tree),
+                    **_analyze_code(code),
+                    "line_count": _line_count(code),
                     "ast_valid": True
                 }
 
@@ -6,9 +6,136 @@ deleting, building, and inspecting datasets in Dataiku
 DSS projects through the dataiku-api-client.
 """
 
+import time
 from typing import Any
 
-from dataiku_mcp.client import get_project, get_project_for_write
+from dataiku_mcp.client import get_client, get_project, get_project_for_write
+
+
+# Dataset types created as SQL table datasets ('sql' is resolved to
+# the connection's database type)
+_SQL_DATASET_TYPES = (
+    'sql', 'sqlserver', 'postgresql', 'mysql', 'oracle', 'synapse'
+)
+
+
+def _create_managed_dataset(project, dataset_name, params):
+    """Create a managed dataset for create_dataset."""
+    builder = project.new_managed_dataset(
+        dataset_name
+    )
+    store_into = params.get(
+        'store_into', 'filesystem_managed'
+    )
+    builder = builder.with_store_into(store_into)
+
+    # Set format if provided
+    format_type = params.get('format_type')
+    if format_type:
+        format_params = params.get(
+            'format_params', {}
+        )
+        builder = builder.with_format(
+            format_type, **format_params
+        )
+
+    return builder.create()
+
+
+def _create_filesystem_dataset(project, dataset_name, params):
+    """Create a filesystem dataset for create_dataset."""
+    connection = params.get(
+        'connection', 'filesystem_managed'
+    )
+    return project.create_filesystem_dataset(
+        dataset_name,
+        connection,
+        params['path']
+    )
+
+
+def _create_sql_dataset(project, dataset_name, dataset_type, params):
+    """Create a SQL table dataset for create_dataset."""
+    connection = params['connection']
+    table = params['table']
+    schema = params.get('schema')
+    catalog = params.get('catalog')
+
+    # Resolve actual DB type — 'sql' is generic, need specific connector type
+    actual_type = dataset_type
+    if dataset_type.lower() == 'sql':
+        try:
+            client = get_client()
+            conn_info = client.get_connection(connection).get_info()
+            actual_type = conn_info.get_type() or 'SQLServer'
+        except Exception:
+            actual_type = 'SQLServer'
+
+    return project.create_sql_table_dataset(
+        dataset_name,
+        actual_type,
+        connection,
+        table,
+        schema,
+        catalog
+    )
+
+
+def _create_s3_dataset(project, dataset_name, params):
+    """Create an S3 dataset for create_dataset."""
+    return project.create_s3_dataset(
+        dataset_name,
+        params['connection'],
+        params['path'],
+        params.get('bucket')
+    )
+
+
+def _create_uploaded_dataset(project, dataset_name, params):
+    """Create an uploaded-files dataset for create_dataset."""
+    return project.create_upload_dataset(
+        dataset_name, params.get('connection')
+    )
+
+
+def _create_generic_dataset(project, dataset_name, dataset_type, params):
+    """Create a dataset of any other type for create_dataset."""
+    return project.create_dataset(
+        dataset_name,
+        dataset_type,
+        params,
+        params.get('format_type'),
+        params.get('format_params', {})
+    )
+
+
+# create_dataset helpers taking (project, dataset_name, params), by
+# lowercased dataset type. SQL types go through _create_sql_dataset and
+# any other type through _create_generic_dataset, which also need the
+# dataset type as given
+_DATASET_CREATORS = {
+    'managed': _create_managed_dataset,
+    'filesystem': _create_filesystem_dataset,
+    's3': _create_s3_dataset,
+    'uploaded': _create_uploaded_dataset,
+}
+
+# Params create_dataset requires by lowercased dataset type, with the
+# error returned when one is missing
+_REQUIRED_DATASET_PARAMS = {
+    'filesystem': (
+        ('path',),
+        "Path is required for filesystem datasets"
+    ),
+    **dict.fromkeys(_SQL_DATASET_TYPES, (
+        ('connection', 'table'),
+        "Connection and table are required for SQL datasets"
+    )),
+    's3': (
+        ('connection', 'path'),
+        "Connection and path are required for S3 datasets"
+    ),
+}
 
 
 def create_dataset(
@@ -52,134 +179,31 @@ def create_dataset(
         project = get_project_for_write(project_key)
         params = params or {}
 
-        # Handle managed datasets
-        if dataset_type.lower() == 'managed':
-            builder = project.new_managed_dataset(
-                dataset_name
-            )
-            store_into = params.get(
-                'store_into', 'filesystem_managed'
-            )
-            builder = builder.with_store_into(store_into)
-
-            # Set format if provided
-            format_type = params.get('format_type')
-            if format_type:
-                format_params = params.get(
-                    'format_params', {}
-                )
-                builder = builder.with_format(
-                    format_type, **format_params
-                )
-
-            dataset = builder.create()
-
-        # Handle filesystem datasets
-        elif dataset_type.lower() == 'filesystem':
-            connection = params.get(
-                'connection', 'filesystem_managed'
-            )
-            path = params.get('path')
-            if not path:
-                return {
-                    "status": "error",
-                    "message": (
-                        "Path is required for"
-                        " filesystem datasets"
-                    )
-                }
-
-            dataset = project.create_filesystem_dataset(
-                dataset_name,
-                connection,
-                path
-            )
-
-        # Handle SQL datasets (type can be 'sql', 'SQLServer', 'PostgreSQL', etc.)
-        elif dataset_type.lower() in ('sql', 'sqlserver', 'postgresql', 'mysql', 'oracle', 'synapse'):
-            connection = params.get('connection')
-            table = params.get('table')
-            schema = params.get('schema')
-            catalog = params.get('catalog')
-
-            if not all([connection, table]):
-                return {
-                    "status": "error",
-                    "message": (
-                        "Connection and table are"
-                        " required for SQL datasets"
-                    )
-                }
-
-            # Resolve actual DB type — 'sql' is generic, need specific connector type
-            actual_type = dataset_type
-            if dataset_type.lower() == 'sql':
-                try:
-                    from dataiku_mcp.client import get_client
-                    client = get_client()
-                    conn_info = client.get_connection(connection).get_info()
-                    actual_type = conn_info.get_type() or 'SQLServer'
-                except Exception:
-                    actual_type = 'SQLServer'
-
-            dataset = (
-                project.create_sql_table_dataset(
-                    dataset_name,
-                    actual_type,
-                    connection,
-                    table,
-                    schema,
-                    catalog
-                )
-            )
-
-        # Handle S3 datasets
-        elif dataset_type.lower() == 's3':
-            connection = params.get('connection')
-            path = params.get('path')
-            bucket = params.get('bucket')
-
-            if not all([connection, path]):
-                return {
-                    "status": "error",
-                    "message": (
-                        "Connection and path are"
-                        " required for S3 datasets"
-                    )
-                }
+        dtype = dataset_type.lower()
+        required, message = _REQUIRED_DATASET_PARAMS.get(
+            dtype, ((), "")
+        )
+        if not all(params.get(name) for name in required):
+            return {
+                "status": "error",
+                "message": message
+            }
 
-            dataset = project.create_s3_dataset(
-                dataset_name,
-                connection,
-                path,
-                bucket
+        if dtype in _DATASET_CREATORS:
+            dataset = _DATASET_CREATORS[dtype](
+                project, dataset_name, params
             )
-
-        # Handle upload datasets
-        elif dataset_type.lower() == 'uploaded':
-            connection = params.get('connection')
-            dataset = project.create_upload_dataset(
-                dataset_name, connection
+        elif dtype in _SQL_DATASET_TYPES:
+            dataset = _create_sql_dataset(
+                project, dataset_name, dataset_type, params
             )
-
-        # Handle generic datasets
         else:
-            format_type = params.get('format_type')
-            format_params = params.get(
-                'format_params', {}
-            )
-
-            dataset = project.create_dataset(
-                dataset_name,
-                dataset_type,
-                params,
-                format_type,
-                format_params
+            dataset = _create_generic_dataset(
+                project, dataset_name, dataset_type, params
             )
 
         # For SQL datasets, autodetect schema from the database
-        sql_types = ('sql', 'sqlserver', 'postgresql', 'mysql', 'oracle', 'synapse')
-        if dataset_type.lower() in sql_types:
+        if dtype in _SQL_DATASET_TYPES:
             try:
                 auto_settings = dataset.autodetect_settings()
                 auto_settings.save()
@@ -189,7 +213,7 @@ def create_dataset(
         # Set additional format parameters if provided
         if (
             params.get('format_type')
-            and dataset_type.lower() != 'managed'
+            and dtype != 'managed'
         ):
             settings = dataset.get_settings()
             settings.set_format_type(
@@ -439,7 +463,8 @@ def build_dataset(
     project_key: str,
     dataset_name: str,
     mode: str | None = None,
-    partition: str | None = None
+    partition: str | None = None,
+    wait: bool = False
 ) -> dict[str, Any]:
     """
     Build a dataset to refresh its content.
@@ -457,6 +482,10 @@ def build_dataset(
                 Recursive forced build
         partition: Optional partition to build
             (for partitioned datasets)
+        wait: Wait up to 10 minutes for the build
+            job to finish; otherwise return as soon
+            as it starts
+            (poll its status with get_job_details)
 
     Returns:
         Dict with status and build job details or
@@ -466,11 +495,10 @@ def build_dataset(
         project = get_project_for_write(project_key)
         dataset = project.get_dataset(dataset_name)
 
-        # Prepare build parameters
-        build_params = {
-            "wait": True,
-            "no_fail": False
-        }
+        # Prepare build parameters; the job is always
+        # started without waiting so its ID is known
+        # even if it fails
+        build_params = {"wait": False}
 
         if mode:
             valid_modes = [
@@ -492,29 +520,60 @@ def build_dataset(
         if partition:
             build_params["partitions"] = partition
 
-        # Build the dataset
+        # Start the build
         job = dataset.build(**build_params)
 
-        # Wait for completion and get result
-        job_result = job.wait_for_completion()
+        if not wait:
+            return {
+                "status": "ok",
+                "dataset_name": dataset_name,
+                "job_id": job.id,
+                "job_status": "RUNNING",
+                "build_mode": mode,
+                "partition": partition,
+                "message": (
+                    f"Build of dataset '{dataset_name}'"
+                    " started"
+                )
+            }
+
+        # Poll for completion, giving up after 10 minutes;
+        # the job keeps running and can be polled with
+        # get_job_details
+        state = ""
+        base_status = {}
+        for _ in range(600):  # max 10 minutes
+            base_status = job.get_status().get(
+                "baseStatus", {}
+            )
+            state = base_status.get("state", "")
+            if state in ("DONE", "FAILED", "ABORTED"):
+                break
+            time.sleep(2)
+
+        if state == "DONE":
+            message = (
+                f"Dataset '{dataset_name}' built successfully"
+            )
+        elif state in ("FAILED", "ABORTED"):
+            message = f"Build did not finish. Status: {state}"
+        else:
+            message = (
+                "Build still running after 10 minutes"
+                f" (status: {state}); poll job '{job.id}'"
+                " with get_job_details"
+            )
 
         return {
-            "status": "ok",
+            "status": "ok" if state == "DONE" else "error",
             "dataset_name": dataset_name,
             "job_id": job.id,
-            "job_status": job_result.get_outcome(),
-            "job_start_time": (
-                job_result.get_start_time()
-            ),
-            "job_end_time": (
-                job_result.get_end_time()
-            ),
+            "job_status": state,
+            "job_start_time": base_status.get("startTime"),
+            "job_end_time": base_status.get("endTime"),
             "build_mode": mode,
             "partition": partition,
-            "message": (
-                f"Dataset '{dataset_name}'"
-                " built successfully"
-            )
+            "message": message
         }
 
     except Exception as e:
@@ -527,6 +586,44 @@ def build_dataset(
         }
 
 
+# Type-specific column fields reported by inspect_dataset_schema,
+# as (output key, schema key, default) per column type
+_NUMERIC_COLUMN_FIELDS = (
+    ('min_value', 'minValue', None),
+    ('max_value', 'maxValue', None),
+)
+_COLUMN_TYPE_FIELDS = {
+    'string': (('max_length', 'maxLength', None),),
+    'int': _NUMERIC_COLUMN_FIELDS,
+    'bigint': _NUMERIC_COLUMN_FIELDS,
+    'float': _NUMERIC_COLUMN_FIELDS,
+    'double': _NUMERIC_COLUMN_FIELDS,
+    'array': (('array_type', 'arrayType', None),),
+    'map': (
+        ('key_type', 'keyType', None),
+        ('value_type', 'valueType', None),
+    ),
+    'object': (('object_fields', 'objectFields', []),),
+}
+
+
+def _column_info(col: dict[str, Any]) -> dict[str, Any]:
+    """Describe one schema column for inspect_dataset_schema."""
+    col_type = col.get('type')
+    column_info = {
+        "name": col.get('name'),
+        "type": col_type,
+        "meaning": col.get('meaning'),
+        "comment": col.get('comment', ''),
+        "nullable": col.get('nullable', True)
+    }
+    for key, schema_key, default in _COLUMN_TYPE_FIELDS.get(
+        col_type, ()
+    ):
+        column_info[key] = col.get(schema_key, default)
+    return column_info
+
+
 def inspect_dataset_schema(
     project_key: str,
     dataset_name: str
@@ -551,49 +648,10 @@ def inspect_dataset_schema(
         schema = dataset.get_schema()
 
         # Process schema columns
-        columns = []
-        for col in schema.get('columns', []):
-            column_info = {
-                "name": col.get('name'),
-                "type": col.get('type'),
-                "meaning": col.get('meaning'),
-                "comment": col.get('comment', ''),
-                "nullable": col.get(
-                    'nullable', True
-                )
-            }
-
-            # Add type-specific information
-            if col.get('type') == 'string':
-                column_info['max_length'] = (
-                    col.get('maxLength')
-                )
-            elif col.get('type') in [
-                'int', 'bigint', 'float', 'double'
-            ]:
-                column_info['min_value'] = (
-                    col.get('minValue')
-                )
-                column_info['max_value'] = (
-                    col.get('maxValue')
-                )
-            elif col.get('type') == 'array':
-                column_info['array_type'] = (
-                    col.get('arrayType')
-                )
-            elif col.get('type') == 'map':
-                column_info['key_type'] = (
-                    col.get('keyType')
-                )
-                column_info['value_type'] = (
-                    col.get('valueType')
-                )
-            elif col.get('type') == 'object':
-                column_info['object_fields'] = (
-                    col.get('objectFields', [])
-                )
-
-            columns.append(column_info)
+        columns = [
+            _column_info(col)
+            for col in schema.get('columns', [])
+        ]
 
         return {
             "status": "ok",
@@ -758,39 +816,33 @@ def list_datasets(
     try:
         project = get_project(project_key)
 
-        # Get all datasets
-        all_datasets = project.list_datasets()
-
-        # Filter by type if specified
-        if dataset_type:
-            filtered_datasets = [
-                d for d in all_datasets
-                if d.get("type") == dataset_type
-            ]
-        else:
-            filtered_datasets = all_datasets
+        # DSS has no server-side type filter, so filter
+        # and project the listing in a single pass
+        datasets = [
+            {
+                "name": ds.get("name"),
+                "type": ds.get("type"),
+                "id": ds.get("id"),
+                "tags": ds.get("tags", []),
+                "managed": ds.get(
+                    "managed", False
+                ),
+                "flow_options": ds.get(
+                    "flowOptions", {}
+                ),
+                "connection": ds.get(
+                    "params", {}
+                ).get("connection")
+            }
+            for ds in project.list_datasets()
+            if not dataset_type
+            or ds.get("type") == dataset_type
+        ]
 
         return {
             "status": "ok",
-            "datasets": [
-                {
-                    "name": ds.get("name"),
-                    "type": ds.get("type"),
-                    "id": ds.get("id"),
-                    "tags": ds.get("tags", []),
-                    "managed": ds.get(
-                        "managed", False
-                    ),
-                    "flow_options": ds.get(
-                        "flowOptions", {}
-                    ),
-                    "connection": ds.get(
-                        "params", {}
-                    ).get("connection")
-                }
-                for ds in filtered_datasets
-            ],
-            "total_count": len(filtered_datasets),
+            "datasets": datasets,
+            "total_count": len(datasets),
             "project_key": project_key
         }
 
@@ -828,11 +880,10 @@ def get_dataset_info(
         # Get dataset metadata
         metadata = dataset.get_metadata()
 
-        # Get dataset settings
-        settings = dataset.get_settings()
-
-        # Get dataset type and configuration
-        dataset_type = dataset.get_type()
+        # Get dataset type and configuration from the
+        # settings, fetched once
+        raw_settings = dataset.get_settings().get_raw()
+        dataset_params = raw_settings.get("params", {})
 
         last_modified_by = metadata.get(
             "lastModifiedBy", {}
@@ -842,14 +893,14 @@ def get_dataset_info(
             "status": "ok",
             "dataset_info": {
                 "name": dataset_name,
-                "type": dataset_type,
+                "type": raw_settings.get("type"),
                 "id": dataset.id,
                 "description": metadata.get(
                     "description", ""
                 ),
                 "tags": metadata.get("tags", []),
-                "managed": (
-                    dataset.get_type() == "Managed"
+                "managed": raw_settings.get(
+                    "managed", False
                 ),
                 "creation_date": metadata.get(
                     "creationDate"
@@ -867,25 +918,15 @@ def get_dataset_info(
                     "flowOptions", {}
                 ),
                 "settings": {
-                    "format_type": getattr(
-                        settings,
-                        'format_type',
-                        None
+                    "format_type": raw_settings.get(
+                        "formatType"
                     ),
-                    "connection": getattr(
-                        settings,
-                        'connection',
-                        None
+                    "connection": dataset_params.get(
+                        "connection"
                     ),
-                    "path": getattr(
-                        settings, 'path', None
-                    ),
-                    "table": getattr(
-                        settings, 'table', None
-                    ),
-                    "schema": getattr(
-                        settings, 'schema', None
-                    )
+                    "path": dataset_params.get("path"),
+                    "table": dataset_params.get("table"),
+                    "schema": dataset_params.get("schema")
                 }
             }
         }
@@ -25,7 +25,6 @@ def get_recent_runs(
     """
     try:
         project = get_project(project_key)
-        get_client()
 
         all_runs = []
 
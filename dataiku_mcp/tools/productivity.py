@@ -3,14 +3,18 @@ Productivity tools for Dataiku MCP integration.
 """
 
 import copy
-import json
 import re
 from datetime import datetime
 from typing import Any
 
 import yaml
 
-from dataiku_mcp.client import get_client, get_project, get_project_for_write
+from dataiku_mcp.client import (
+    get_auth_info,
+    get_client,
+    get_project,
+    get_project_for_write,
+)
 
 
 def create_project(
@@ -31,7 +35,7 @@ def create_project(
     """
     try:
         client = get_client()
-        auth_info = client.get_auth_info()
+        auth_info = get_auth_info()
         owner = auth_info.get("authIdentifier", "admin")
 
         project = client.create_project(project_key, name, owner)
@@ -508,7 +512,9 @@ def export_project_config(
         format: Export format (json/yaml)
 
     Returns:
-        Dict containing exported configuration
+        Dict containing exported configuration; YAML exports also include
+        the rendered text in "config_output" and its length in
+        export_stats["export_size"]
     """
     try:
         project = get_project(project_key)
@@ -759,9 +765,9 @@ def export_project_config(
                     ),
                 }
         else:
-            config_output = json.dumps(
-                config, indent=2, default=str
-            )
+            # The config dict is itself the JSON export; it is serialized
+            # once by the MCP transport, so it is not duplicated as a string
+            config_output = None
             content_type = "json"
 
         # Export statistics
@@ -793,17 +799,21 @@ def export_project_config(
             "recipes_exported": rc_exported,
             "scenarios_exported": sc_exported,
             "variables_exported": vars_exported,
-            "export_size": len(config_output),
             "total_objects": total_objects,
         }
 
-        return {
+        result = {
             "status": "ok",
             "export_stats": export_stats,
             "config": config,
-            "config_output": config_output,
             "content_type": content_type
         }
+        if config_output is not None:
+            # Only a rendered export has a size to report; JSON exports
+            # are not serialized here just to measure them
+            export_stats["export_size"] = len(config_output)
+            result["config_output"] = config_output
+        return result
 
     except Exception as e:
         return {
@@ -2,7 +2,9 @@
 Project exploration tools for Dataiku MCP integration.
 """
 
+import itertools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from dataiku_mcp.client import get_client, get_project, get_project_for_write
@@ -210,179 +212,72 @@ def search_project_objects(
                 "scenarios",
             ]
 
-        # Compile regex pattern
+        # Compile the pattern once; terms that are not valid regex
+        # are matched literally
         try:
             pattern = re.compile(
                 search_term, re.IGNORECASE
             )
         except re.error:
-            # If regex fails, use simple string matching
-            pattern = None
-
-        search_results = {}
-
-        # Search datasets
-        if "datasets" in object_types:
-            datasets = project.list_datasets()
-            matching_datasets = []
-
-            for dataset in datasets:
-                name = dataset["name"]
-                description = dataset.get(
-                    "description", ""
-                )
-                tags = dataset.get("tags", [])
-
-                # Check if matches
-                matches = False
-                if pattern:
-                    matches = (
-                        pattern.search(name)
-                        or pattern.search(description)
-                        or any(
-                            pattern.search(tag)
-                            for tag in tags
-                        )
-                    )
-                else:
-                    term = search_term.lower()
-                    matches = (
-                        term in name.lower()
-                        or term in description.lower()
-                        or any(
-                            term in tag.lower()
-                            for tag in tags
-                        )
-                    )
-
-                if matches:
-                    term = search_term.lower()
-                    match_type = (
-                        "name"
-                        if term in name.lower()
-                        else "metadata"
-                    )
-                    matching_datasets.append({
-                        "name": name,
-                        "type": dataset["type"],
-                        "description": description,
-                        "tags": tags,
-                        "match_type": match_type,
-                    })
-
-            search_results["datasets"] = (
-                matching_datasets
-            )
-
-        # Search recipes
-        if "recipes" in object_types:
-            recipes = project.list_recipes()
-            matching_recipes = []
-
-            for recipe in recipes:
-                name = recipe["name"]
-                description = recipe.get(
-                    "description", ""
-                )
-                tags = recipe.get("tags", [])
-
-                # Check if matches
-                matches = False
-                if pattern:
-                    matches = (
-                        pattern.search(name)
-                        or pattern.search(description)
-                        or any(
-                            pattern.search(tag)
-                            for tag in tags
-                        )
-                    )
-                else:
-                    term = search_term.lower()
-                    matches = (
-                        term in name.lower()
-                        or term in description.lower()
-                        or any(
-                            term in tag.lower()
-                            for tag in tags
-                        )
-                    )
-
-                if matches:
-                    term = search_term.lower()
-                    match_type = (
-                        "name"
-                        if term in name.lower()
-                        else "metadata"
-                    )
-                    matching_recipes.append({
-                        "name": name,
-                        "type": recipe["type"],
-                        "description": description,
-                        "tags": tags,
-                        "match_type": match_type,
-                    })
-
-            search_results["recipes"] = (
-                matching_recipes
+            pattern = re.compile(
+                re.escape(search_term), re.IGNORECASE
             )
+        term = search_term.lower()
 
-        # Search scenarios
-        if "scenarios" in object_types:
-            scenarios = project.list_scenarios()
-            matching_scenarios = []
+        # The object lists are independent, so fetch them concurrently
+        listers = {
+            "datasets": project.list_datasets,
+            "recipes": project.list_recipes,
+            "scenarios": project.list_scenarios,
+        }
+        wanted = [t for t in listers if t in object_types]
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(wanted))
+        ) as pool:
+            listings = dict(zip(
+                wanted,
+                pool.map(lambda t: listers[t](), wanted),
+            ))
 
-            for scenario in scenarios:
-                name = scenario["name"]
-                description = scenario.get(
+        search_results = {}
+        for obj_type, objects in listings.items():
+            matching = []
+            for obj in objects:
+                name = obj["name"]
+                description = obj.get(
                     "description", ""
                 )
-                tags = scenario.get("tags", [])
-
-                # Check if matches
-                matches = False
-                if pattern:
-                    matches = (
-                        pattern.search(name)
-                        or pattern.search(description)
-                        or any(
-                            pattern.search(tag)
-                            for tag in tags
-                        )
-                    )
-                else:
-                    term = search_term.lower()
-                    matches = (
-                        term in name.lower()
-                        or term in description.lower()
-                        or any(
-                            term in tag.lower()
-                            for tag in tags
-                        )
+                tags = obj.get("tags", [])
+
+                if not (
+                    pattern.search(name)
+                    or pattern.search(description)
+                    or any(
+                        pattern.search(tag)
+                        for tag in tags
                     )
+                ):
+                    continue
 
-                if matches:
-                    term = search_term.lower()
-                    match_type = (
+                match = {
+                    "name": name,
+                    "type": obj["type"],
+                    "description": description,
+                    "tags": tags,
+                    "match_type": (
                         "name"
                         if term in name.lower()
                         else "metadata"
+                    ),
+                }
+                if obj_type == "scenarios":
+                    match["id"] = obj["id"]
+                    match["active"] = obj.get(
+                        "active", False
                     )
-                    matching_scenarios.append({
-                        "name": name,
-                        "id": scenario["id"],
-                        "type": scenario["type"],
-                        "description": description,
-                        "tags": tags,
-                        "active": scenario.get(
-                            "active", False
-                        ),
-                        "match_type": match_type,
-                    })
+                matching.append(match)
 
-            search_results["scenarios"] = (
-                matching_scenarios
-            )
+            search_results[obj_type] = matching
 
         # Calculate search statistics
         total_matches = sum(
@@ -435,6 +330,14 @@ def get_dataset_sample(
     Returns:
         Dict containing sample data and schema
     """
+    # iter_rows() opens the HTTP stream at once; with no rows to read
+    # it would never be released
+    if rows < 1:
+        return {
+            "status": "error",
+            "message": "rows must be at least 1",
+        }
+
     try:
         project = get_project(project_key)
         dataset = project.get_dataset(dataset_name)
@@ -479,59 +382,34 @@ def get_dataset_sample(
                 for col in schema_columns
             ]
 
-        # Get sample data
+        # Stream rows from DSS and stop as soon as enough have
+        # been read; closing the iterator closes the HTTP stream
+        # so the rest of the dataset is never downloaded.
+        schema_names = [col["name"] for col in schema_columns]
+        indices = [schema_names.index(col) for col in columns]
+        sample_data = []
+        row_iter = None
         try:
-            if columns and len(columns) < len(
-                schema_columns
-            ):
-                # If specific columns requested,
-                # get dataframe and select columns
-                df = dataset.get_dataframe(
-                    limit=rows
-                )
-                df = df[columns]
-                sample_data = df.to_dict('records')
-            else:
-                # Get full sample
-                df = dataset.get_dataframe(
-                    limit=rows
-                )
-                sample_data = df.to_dict('records')
-
-            actual_rows = len(sample_data)
+            # iter_rows() starts the request when called
+            row_iter = dataset.iter_rows()
+            for row in itertools.islice(row_iter, rows):
+                sample_data.append({
+                    col: row[i] if i < len(row) else None
+                    for col, i in zip(columns, indices)
+                })
+        except Exception as e2:
+            return {
+                "status": "error",
+                "message": (
+                    "Failed to read sample"
+                    f" data: {str(e2)}"
+                ),
+            }
+        finally:
+            if row_iter is not None:
+                row_iter.close()
 
-        except Exception:
-            # Fallback to row iterator if df fails
-            try:
-                sample_data = []
-                for i, row in enumerate(
-                    dataset.iter_rows()
-                ):
-                    if i >= rows:
-                        break
-
-                    # Filter to requested columns
-                    if columns:
-                        filtered_row = {
-                            col: row.get(col)
-                            for col in columns
-                        }
-                        sample_data.append(
-                            filtered_row
-                        )
-                    else:
-                        sample_data.append(row)
-
-                actual_rows = len(sample_data)
-
-            except Exception as e2:
-                return {
-                    "status": "error",
-                    "message": (
-                        "Failed to read sample"
-                        f" data: {str(e2)}"
-                    ),
-                }
+        actual_rows = len(sample_data)
 
         # Calculate sample statistics
         col_names = columns if columns else [
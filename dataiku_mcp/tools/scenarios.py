@@ -320,7 +320,7 @@ def add_scenario_trigger(
                 minute (int), year (int),
                 month (int)
             For 'dataset': dataset_name (str),
-                project_key (str, optional)
+                dataset_project_key (str, optional)
             For 'time': Use one of the specific
                 time trigger types above
 
@@ -470,7 +470,7 @@ def add_scenario_trigger(
                 'dataset_name'
             )
             dataset_project_key = params.get(
-                'project_key', project_key
+                'dataset_project_key', project_key
             )
 
             settings.add_dataset_trigger(
@@ -8,15 +8,31 @@ import logging
 import sys
 from pathlib import Path
 
+import anyio
+
 # Add the parent directory to the path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from dataiku_mcp.client import reset_client
 from dataiku_mcp.server import create_server
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _backend_options() -> dict:
+    """
+    anyio backend options that run the server on a uvloop event loop when
+    uvloop is installed; the loop is passed as a factory, so the global
+    event loop policy is left alone.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {}
+    logger.debug("Using uvloop event loop")
+    return {"loop_factory": uvloop.new_event_loop}
+
 def main():
     """Main entrypoint for the MCP server."""
     parser = argparse.ArgumentParser(description="Dataiku MCP Server")
@@ -50,6 +66,8 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    backend_options = _backend_options()
+
     # Create server
     try:
         server = create_server()
@@ -58,16 +76,25 @@ def main():
         # Run server based on transport
         if args.transport == "stdio":
             logger.info("Using stdio transport")
-            server.run()
+            anyio.run(
+                server.run_stdio_async, backend_options=backend_options
+            )
         elif args.transport == "sse":
-            logger.info(f"Using SSE transport on {args.host}:{args.port}")
-            server.run_sse(host=args.host, port=args.port)
+            logger.info("Using SSE transport on %s:%s", args.host, args.port)
+            server.settings.host = args.host
+            server.settings.port = args.port
+            anyio.run(
+                server.run_sse_async, backend_options=backend_options
+            )
 
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
+    finally:
+        # Close the pooled DSS connections once, at process shutdown
+        reset_client()
 
 if __name__ == "__main__":
     main()